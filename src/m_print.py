@@ -227,7 +227,7 @@ class ComLogger(BaseLogger):
         """
         try:
             log_message = self._create_log_message(tx_data, cmd, addr)
-            hex_data = " ".join([f"{b:02X}" for b in tx_data])
+            hex_data = bytes(tx_data).hex(" ").upper()
             hex_lines = [hex_data[i : i + HEX_LINE_WIDTH] for i in range(0, len(hex_data), HEX_LINE_WIDTH)]
             log_message += "\n".join(hex_lines) + "\n"
 
@@ -11,6 +11,14 @@ from src.logger_instance import log
 
 logger = logging.getLogger(__name__)
 
+# 日志文件读取缓冲区大小，减少大文件逐行读取时的系统调用次数
+READ_BUFFER_SIZE = 1 << 20
+
+# 与协议无关的固定模式在模块导入时编译一次，所有提取器实例共享
+_INFO_LINE_RE = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}[:|\.]\d{2,3}")
+_DIRECTION_RE = re.compile(r"(Send|Recv|TX|RX)", re.IGNORECASE)
+_TERMINAL_ID_RE = re.compile(r"\[(\d+)\]\s+\w+.*?:")  # 匹配 [数字] 终端ID
+
 
 class ProtocolDataExtractor:
     """协议数据提取器类
@@ -26,11 +34,11 @@ class ProtocolDataExtractor:
         """
         self.frame_head_pattern = frame_head_pattern
 
-        # 预编译正则表达式（性能优化：避免重复编译）
-        self._info_line_re = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}[:|\.]\d{2,3}")
+        # 预编译正则表达式（性能优化：避免重复编译），仅帧头模式随协议变化
+        self._info_line_re = _INFO_LINE_RE
         self._byte_sequence_re = re.compile(frame_head_pattern)
-        self._direction_re = re.compile(r"(Send|Recv|TX|RX)", re.IGNORECASE)
-        self._terminal_id_re = re.compile(r"\[(\d+)\]\s+\w+.*?:")  # 匹配 [数字] 终端ID
+        self._direction_re = _DIRECTION_RE
+        self._terminal_id_re = _TERMINAL_ID_RE
 
     def extract_from_file(self, file_path: str) -> List[Dict[str, Any]]:
         """从文件中提取数据组
@@ -54,8 +62,15 @@ class ProtocolDataExtractor:
         current_group = None
         is_collecting_data = False
 
+        def _finish_group(group: Dict[str, Any]) -> None:
+            """数据组结束时合并 data_parts 为 data 字符串，丢弃没有数据的组"""
+            data_parts = group.pop("data_parts")
+            if data_parts:
+                group["data"] = " ".join(data_parts)
+                data_groups.append(group)
+
         try:
-            with open(file_path, "r", encoding="utf-8") as file:
+            with open(file_path, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE) as file:
                 for line in file:
                     line = line.strip()
                     if line == "":
@@ -69,7 +84,7 @@ class ProtocolDataExtractor:
                     if info_line_match:
                         # 保存上一个数据组
                         if current_group:
-                            data_groups.append(current_group)
+                            _finish_group(current_group)
                             is_collecting_data = False
 
                         # 提取时间戳
@@ -105,16 +120,7 @@ class ProtocolDataExtractor:
 
                 # 处理最后一个数据组
                 if current_group:
-                    data_groups.append(current_group)
-
-                # 合并 data_parts 为 data 字符串
-                for group in data_groups:
-                    if "data_parts" in group:
-                        group["data"] = " ".join(group["data_parts"])
-                        del group["data_parts"]
-
-                # 过滤空数据组
-                data_groups = [g for g in data_groups if g.get("data")]
+                    _finish_group(current_group)
 
             return data_groups
 
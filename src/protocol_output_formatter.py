@@ -65,9 +65,9 @@ class ProtocolOutputFormatter:
 
         # 写入文件
         try:
+            # 整体拼接后一次写入，避免逐行调用 write
             with open(output_path, "w", encoding="utf-8") as f:
-                for line in output_lines:
-                    f.write(line + "\n")
+                f.write("\n".join(output_lines) + "\n")
             return os.path.abspath(output_path)
         except Exception as e:
             log.e_print(f"保存解析结果失败: {e}")
@@ -14,6 +14,30 @@ from src.yaml_cmdformat import YamlCmdFormat
 
 logger = logging.getLogger(__name__)
 
+# 头部无符号整数解包函数：{(字节数, 是否小端): Struct.unpack}，按长度查表代替逐个分支判断
+_UINT_UNPACKERS = {
+    (size, little): struct.Struct(("<" if little else ">") + fmt_char).unpack
+    for size, fmt_char in ((1, "B"), (2, "H"), (4, "I"), (8, "Q"))
+    for little in (True, False)
+}
+
+
+def _parse_log_timestamp(timestamp_str: str) -> datetime:
+    """解析日志时间戳（格式：YYYY-MM-DD HH:MM:SS.mmm）
+
+    标准毫秒格式走 datetime.fromisoformat（C 实现，比 strptime 快一个数量级），
+    其余格式仍交给 strptime 处理。
+    """
+    if (
+        len(timestamp_str) == 23
+        and timestamp_str[4] == "-"
+        and timestamp_str[7] == "-"
+        and timestamp_str[10] == " "
+        and timestamp_str[19] == "."
+    ):
+        return datetime.fromisoformat(timestamp_str)
+    return datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S.%f")
+
 
 class ProtocolParser:
     """协议解析器类
@@ -36,6 +60,9 @@ class ProtocolParser:
             "errors": 0,
         }
 
+        # 过滤条件，默认不过滤
+        self.set_filters()
+
     def reset_stats(self) -> None:
         """重置性能统计数据"""
         self.perf_stats = {
@@ -60,6 +87,10 @@ class ProtocolParser:
         self._exclude_cmds = exclude_cmds
         self._time_range = time_range
 
+        # 逐帧过滤时使用集合做 O(1) 成员判断，原列表保留供外部读取
+        self._include_cmd_set = frozenset(include_cmds) if include_cmds is not None else None
+        self._exclude_cmd_set = frozenset(exclude_cmds) if exclude_cmds is not None else None
+
     def parse_data_groups(
         self,
         data_groups: List[Dict[str, Any]],
@@ -78,29 +109,38 @@ class ProtocolParser:
         """
         parsed_data_groups = []
         total_count = len(data_groups)
+        last_progress = -1
 
         for index, group in enumerate(data_groups):
             # 检查停止标志
             if should_stop_callback and should_stop_callback():
                 break
 
-            # 发送进度更新（10-80%用于数据解析阶段）
+            # 发送进度更新（10-80%用于数据解析阶段），进度值变化时才回调，
+            # 整个解析阶段最多回调约 70 次，而不是每帧一次
             if progress_callback:
-                progress = 10 + int((index / total_count) * 70)
-                try:
-                    progress_callback(progress, 100)
-                except Exception:
-                    pass  # 忽略回调异常
+                progress = 10 + index * 70 // total_count
+                if progress != last_progress:
+                    last_progress = progress
+                    try:
+                        progress_callback(progress, 100)
+                    except Exception:
+                        pass  # 忽略回调异常
 
             try:
-                # 解析数据字节
-                data_bytes = group["data"].strip().split()
-                if len(data_bytes) < self.yaml_config.head_len:
+                # 转换为字节数组（性能优化：fromhex 自动跳过字节间的空白，
+                # 无需先 split 再 join；格式不规整时回退到按空白拆分拼接）
+                data = group["data"]
+                try:
+                    byte_data = bytes.fromhex(data)
+                except ValueError:
+                    data_bytes = data.split()
+                    if len(data_bytes) < self.yaml_config.head_len:
+                        continue
+                    byte_data = bytes.fromhex("".join(data_bytes))
+                if len(byte_data) < self.yaml_config.head_len:
                     continue
 
-                # 转换为字节数组（性能优化：使用 fromhex 替代列表推导）
-                byte_data = bytes.fromhex("".join(data_bytes))
-
                 # 解析头部字段
                 header_info = self._parse_header(byte_data[: self.yaml_config.head_len])
                 if not header_info:
@@ -231,18 +271,10 @@ class ProtocolParser:
         Raises:
             ValueError: 不支持的数据长度
         """
-        fmt = "<" if endian == "little" else ">"
-
-        if len(data) == 1:
-            return struct.unpack("B", data)[0]
-        elif len(data) == 2:
-            return struct.unpack(fmt + "H", data)[0]
-        elif len(data) == 4:
-            return struct.unpack(fmt + "L", data)[0]
-        elif len(data) == 8:
-            return struct.unpack(fmt + "Q", data)[0]
-        else:
+        unpack = _UINT_UNPACKERS.get((len(data), endian == "little"))
+        if unpack is None:
             raise ValueError(f"不支持的 uint 大小: {len(data)}")
+        return unpack(data)[0]
 
     def _check_cmd_filter(self, cmd_id: int) -> bool:
         """检查命令ID是否通过过滤条件
@@ -254,12 +286,14 @@ class ProtocolParser:
             True 表示通过（应该解析），False 表示不通过（应该跳过）
         """
         # 如果设置了包含列表，只解析列表中的命令
-        if hasattr(self, "_include_cmds") and self._include_cmds is not None:
-            return cmd_id in self._include_cmds
+        include_cmd_set = self._include_cmd_set
+        if include_cmd_set is not None:
+            return cmd_id in include_cmd_set
 
         # 如果设置了排除列表，跳过列表中的命令
-        if hasattr(self, "_exclude_cmds") and self._exclude_cmds is not None:
-            return cmd_id not in self._exclude_cmds
+        exclude_cmd_set = self._exclude_cmd_set
+        if exclude_cmd_set is not None:
+            return cmd_id not in exclude_cmd_set
 
         # 都没有设置，解析所有命令
         return True
@@ -273,12 +307,12 @@ class ProtocolParser:
         Returns:
             True 表示通过（在范围内），False 表示不通过（不在范围内）
         """
-        if not hasattr(self, "_time_range") or self._time_range is None:
+        if self._time_range is None:
             return True  # 没有设置时间过滤，全部通过
 
         try:
             # 解析时间戳
-            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S.%f")
+            timestamp = _parse_log_timestamp(timestamp_str)
             start_time, end_time = self._time_range
             return start_time <= timestamp <= end_time
         except (ValueError, TypeError):
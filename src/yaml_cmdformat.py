@@ -26,6 +26,7 @@ class YamlCmdFormat:
         config_path: YAML配置文件路径
         config: 协议配置对象
         field_parser: 字段解析器实例
+        _cmd_set: 支持的命令ID集合（缓存）
     """
 
     def __init__(self, protocol_yaml_path: Union[str, Path]):
@@ -37,6 +38,8 @@ class YamlCmdFormat:
         self.config_path = Path(protocol_yaml_path)
         self.config = yaml_loader.load_protocol_config(self.config_path)
         self.field_parser = YamlFieldParser(self.config)
+        # 命令集合在配置加载后不再变化，预先计算供高频查询复用
+        self._cmd_set = frozenset(self.config.cmds)
 
     def get_cmd_layout(self, cmd_id: int) -> List[Union[Field, Group]]:
         """获取命令的字段布局
@@ -61,7 +64,7 @@ class YamlCmdFormat:
         Returns:
             如果支持返回True，否则返回False
         """
-        return cmd_id in self.config.cmds
+        return cmd_id in self._cmd_set
 
     def parse_cmd_data(self, cmd_id: int, data: bytes) -> Dict[str, Any]:
         """解析命令数据
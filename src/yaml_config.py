@@ -3,15 +3,50 @@ YAML配置加载器和数据模型
 统一管理所有协议配置，取代原有的format.txt、field_types.ini、filter.txt
 """
 
+import hashlib
 import logging
+import os
+import pickle
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML 未带 libyaml 扩展时回退到纯Python实现
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 
+# 磁盘缓存文件后缀，文件名为YAML内容与本模块源码的摘要
+DISK_CACHE_SUFFIX = ".pickle"
+
+# 解析时逐字段访问的描述对象使用 __slots__（Python 3.10+ 支持），属性访问更快、内存更省
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@lru_cache(maxsize=None)
+def _code_digest() -> Optional[bytes]:
+    """本模块源码与解释器版本的摘要，数据类或解析逻辑一改，旧缓存自然失效
+
+    读不到源码（如打包后的程序）时返回 None，此时不使用磁盘缓存。
+    """
+    try:
+        source = Path(__file__).read_bytes()
+    except OSError:
+        return None
+    version = f"{sys.version_info[0]}.{sys.version_info[1]}".encode()
+    return hashlib.sha256(version + b"\0" + source).digest()
+
+
+def _intern_key(value: Any) -> Any:
+    """驻留用作字典键的字符串（字段名、字段ID等），非字符串原样返回"""
+    return sys.intern(value) if type(value) is str else value
+
 
 @dataclass
 class Meta:
@@ -23,7 +58,7 @@ class Meta:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BitfieldGroup:
     """位段组定义"""
 
@@ -33,7 +68,7 @@ class BitfieldGroup:
     enum: Optional[str] = None  # 枚举名称
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TypeDef:
     """类型定义"""
 
@@ -99,7 +134,7 @@ class EnumDef:
     values: Dict[int, str]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Field:
     """字段定义"""
 
@@ -130,7 +165,7 @@ class Field:
         return [BitfieldGroup(**group_data) for group_data in self.bit_groups]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Group:
     """字段组（循环）"""
 
@@ -165,25 +200,44 @@ class ProtocolConfig:
 class YamlConfigLoader:
     """YAML配置加载器"""
 
-    def __init__(self):
-        self._cache: Dict[str, ProtocolConfig] = {}
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None):
+        """初始化加载器
+
+        Args:
+            cache_dir: 磁盘缓存目录，默认不启用
+        """
+        # {绝对路径: ((mtime_ns, size), 配置)}，文件变化后自动失效
+        self._cache: Dict[str, Tuple[Tuple[int, int], ProtocolConfig]] = {}
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+    def enable_disk_cache(self, cache_dir: Union[str, Path]) -> None:
+        """为已创建的加载器（如全局 yaml_loader）启用磁盘缓存
+
+        Args:
+            cache_dir: 磁盘缓存目录，不应与YAML配置放在同一目录
+        """
+        self._cache_dir = Path(cache_dir)
 
     def load_protocol_config(self, config_path: Union[str, Path]) -> ProtocolConfig:
-        """加载协议配置"""
-        config_path = Path(config_path)
+        """加载协议配置
 
-        if str(config_path) in self._cache:
-            return self._cache[str(config_path)]
+        同一文件未修改时直接返回缓存的配置对象。
+        """
+        config_path = Path(config_path)
 
         if not config_path.exists():
             raise FileNotFoundError(f"Protocol config file not found: {config_path}")
 
-        try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+        stat = config_path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cache_key = str(config_path.resolve())
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
 
-            config = self._parse_config(data)
-            self._cache[str(config_path)] = config
+        try:
+            config = self._load_config(config_path)
+            self._cache[cache_key] = (signature, config)
 
             logger.info(f"Loaded protocol config: {config.meta.protocol}")
             return config
@@ -192,6 +246,60 @@ class YamlConfigLoader:
             logger.error(f"Failed to load protocol config {config_path}: {e}")
             raise
 
+    def _load_config(self, config_path: Path) -> ProtocolConfig:
+        """解析配置文件，启用磁盘缓存时优先命中缓存
+
+        缓存保存构建完成的 ProtocolConfig 对象，文件名由YAML内容和本模块源码的摘要决定，
+        任一变化都会落到新的缓存文件；缓存读写失败（目录只读、文件损坏等）不影响正常加载。
+        """
+        raw = config_path.read_bytes()
+        code_digest = _code_digest() if self._cache_dir is not None else None
+        if code_digest is None:
+            return self._parse_config(self._read_yaml(raw))
+
+        digest = hashlib.sha256(code_digest + raw).hexdigest()
+        cache_path = self._cache_dir / f"{digest}{DISK_CACHE_SUFFIX}"
+
+        try:
+            with open(cache_path, "rb") as f:
+                config = pickle.load(f)
+            # 同一份代码可能以 yaml_config / src.yaml_config 两种模块名导入，
+            # 类型不一致的缓存对象会让 isinstance 判断失效，需重新解析
+            if isinstance(config, ProtocolConfig):
+                return config
+            logger.debug(f"Ignoring config cache {cache_path}: unexpected {type(config)}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Failed to load config cache {cache_path}: {e}")
+
+        config = self._parse_config(self._read_yaml(raw))
+
+        # 先写临时文件再替换，避免并发进程读到半截缓存
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            self._cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug(f"Failed to write config cache {cache_path}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+        return config
+
+    @staticmethod
+    def _read_yaml(raw: bytes) -> Dict[str, Any]:
+        """解析一次性读入的整个文件内容
+
+        协议配置文件很小，直接把字节串交给 libyaml 比逐块回调文件对象更快；
+        PyYAML 会按 BOM 识别编码，默认 UTF-8。
+        """
+        return yaml.load(raw, Loader=_YamlLoader)
+
     def _parse_config(self, data: Dict[str, Any]) -> ProtocolConfig:
         """解析配置数据"""
         # 解析元数据
@@ -252,14 +360,14 @@ class YamlConfigLoader:
                     # 新格式：group字段包含fields
                     group_data = field_data["group"]
                     group = Group(
-                        repeat_by=field_data.get("repeat_by"),
+                        repeat_by=_intern_key(field_data.get("repeat_by")),
                         repeat_const=field_data.get("repeat_const"),
                         fields=self._parse_fields(group_data.get("fields", [])),
                     )
                 else:
                     # 兼容格式：直接在字段数据中指定repeat_by/repeat_const
                     group = Group(
-                        repeat_by=field_data.get("repeat_by"),
+                        repeat_by=_intern_key(field_data.get("repeat_by")),
                         repeat_const=field_data.get("repeat_const"),
                         fields=self._parse_fields(field_data.get("fields", [])),
                     )
@@ -267,6 +375,9 @@ class YamlConfigLoader:
             else:
                 # 这是一个普通字段
                 field_obj = Field(**field_data)
+                # 字段名和ID是解析结果与上下文的字典键，驻留后各命令中的同名键共享同一对象
+                field_obj.name = _intern_key(field_obj.name)
+                field_obj.id = _intern_key(field_obj.id)
                 fields.append(field_obj)
 
         return fields
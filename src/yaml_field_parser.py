@@ -3,18 +3,139 @@
 统一处理各种数据类型的解析和转换
 """
 
-import binascii
+import codecs
 import logging
 import struct
 from datetime import datetime
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
 
 from src.yaml_config import Field, Group, ProtocolConfig, TypeDef
 
 logger = logging.getLogger(__name__)
 MISSING_FIELD_PLACEHOLDER = "无数据，未解析"
 
+# 预编译的整数解包函数：{(是否有符号, 字节数, 是否小端): Struct.unpack_from}
+# 使用 unpack_from 直接按偏移读取原始缓冲区，无需为每个字段切片复制
+_INT_UNPACKERS = {
+    (signed, size, little): struct.Struct(
+        ("<" if little else ">") + (fmt_char.lower() if signed else fmt_char)
+    ).unpack_from
+    for size, fmt_char in ((1, "B"), (2, "H"), (4, "I"), (8, "Q"))
+    for signed in (False, True)
+    for little in (True, False)
+}
+
+# CP56Time2a：毫秒(2, 小端) + 分 + 时 + 日 + 月 + 年
+_CP56_UNPACK = struct.Struct("<HBBBBB").unpack
+
+# 单字节BCD转十进制查找表，含无效半字节（A-F）的字节映射为 _BCD_INVALID_BYTE
+_BCD_INVALID_BYTE = 0xFF
+_BCD_TO_INT = bytes(
+    (b >> 4) * 10 + (b & 0x0F) if (b >> 4) <= 9 and (b & 0x0F) <= 9 else _BCD_INVALID_BYTE
+    for b in range(256)
+)
+
+# BCD解码时需丢弃的无效半字节（bytes.hex() 输出为小写）
+_BCD_INVALID_NIBBLES = str.maketrans("", "", "abcdef")
+
+
+@lru_cache(maxsize=256)
+def _int_array_unpacker(signed: bool, size: int, little: bool, count: int) -> Callable:
+    """count 个同宽整数连续排列时的一次性解包函数 Struct.unpack_from"""
+    fmt_char = {1: "B", 2: "H", 4: "I", 8: "Q"}[size]
+    fmt = f"{'<' if little else '>'}{count}{fmt_char.lower() if signed else fmt_char}"
+    return struct.Struct(fmt).unpack_from
+
+
+def _decimal_places(scale: float) -> int:
+    """根据缩放因子确定小数位数"""
+    if scale == 0:
+        return 0
+    # 将 scale 转换为字符串，计算小数位数
+    scale_str = f"{scale:.10f}".rstrip("0").rstrip(".")
+    if "." in scale_str:
+        return len(scale_str.split(".")[1])
+    return 0
+
+
+@lru_cache(maxsize=None)
+def _scale_quantize_params(scale: float) -> tuple:
+    """缩放因子 -> (Decimal 缩放因子, 四舍五入量化单位, 整数缩放比例或None)，每个 scale 值只计算一次
+
+    整数缩放比例为 scale 的最简分数 (分子, 分母)。整数原始值乘以 scale 的精确结果
+    小数位数不超过量化位数时，四舍五入不改变数值，可直接用整数真除法得到同一个浮点数。
+    """
+    scale_factor = Decimal(str(scale))
+    places = _decimal_places(scale)
+    ratio = None
+    if scale_factor.is_finite():
+        numerator, denominator = scale_factor.as_integer_ratio()
+        if 10**places % denominator == 0:
+            ratio = (numerator, denominator)
+    return scale_factor, Decimal(10) ** -places, ratio
+
+
+def _scale_value(raw_value: Union[int, float], params: tuple) -> float:
+    """按 _scale_quantize_params 的结果缩放并四舍五入到 scale 的小数位数"""
+    scale_factor, quantum, ratio = params
+    if ratio is not None and type(raw_value) is int:
+        # int 真除法结果为精确值最近的浮点数，与 Decimal 计算后 float() 一致
+        return raw_value * ratio[0] / ratio[1]
+    decimal_value = Decimal(str(raw_value)) * scale_factor
+    return float(decimal_value.quantize(quantum, rounding=ROUND_HALF_UP))
+
+
+@lru_cache(maxsize=4096)
+def _local_minute_prefix(minute: int) -> Optional[str]:
+    """Unix分钟数对应的本地时间前缀 "YYYY-MM-DD HH:MM:"
+
+    同一分钟内的秒级时间戳共用一个前缀，连续帧的时间戳只需拼接秒数即可，
+    无需每次构造 datetime 并 strftime。早年的地方平时（如 1972 年前的
+    Africa/Monrovia，-00:44:30）等偏移带秒数，这一分钟在本地时间中不是从 :00
+    走到 :59，此时返回 None，由调用方按完整时间戳格式化。
+    """
+    start = datetime.fromtimestamp(minute * 60)
+    if start.second != 0 or datetime.fromtimestamp(minute * 60 + 59).second != 59:
+        return None
+    return start.strftime("%Y-%m-%d %H:%M:")
+
+
+@lru_cache(maxsize=None)
+def _is_ascii_compatible(encoding: str) -> bool:
+    """该编码解码纯ASCII字节的结果是否与ASCII相同（UTF-8、GBK等为真，UTF-16等为假）"""
+    ascii_bytes = bytes(range(128))
+    try:
+        return ascii_bytes.decode(encoding) == ascii_bytes.decode("ascii")
+    except (LookupError, UnicodeDecodeError):
+        return False
+
+
+# CPython 对这些编码的 bytes.decode 有内建快速路径，按名称解码比调用编解码器对象更快
+_BUILTIN_DECODE_CODECS = frozenset({"ascii", "utf-8", "iso8859-1"})
+
+
+@lru_cache(maxsize=None)
+def _resolve_codec(encoding: str) -> tuple:
+    """解析字符串编码 -> (规范编码名, 解码函数或None, 是否兼容ASCII)
+
+    每个编码名只查询一次编解码器注册表；未知编码抛出 LookupError。
+    """
+    codec = codecs.lookup(encoding)
+    decode = None if codec.name in _BUILTIN_DECODE_CODECS else codec.decode
+    return codec.name, decode, _is_ascii_compatible(codec.name)
+
+
+class _IntRun(NamedTuple):
+    """解析计划中可一次解包的连续整数字段段"""
+
+    unpack: Callable  # Struct.unpack_from
+    size: int  # 总字节数
+    names: tuple  # 各字段名
+    ids: tuple  # ((字段下标, 字段ID), ...)
+    fields: list  # 原字段列表，数据不足时逐字段解析
+
 
 class FieldDataMissing(ValueError):
     """字段数据不足异常"""
@@ -44,7 +165,7 @@ class YamlFieldParser:
     Attributes:
         config: 协议配置对象
         type_parsers: 类型解析器映射表
-        _struct_cache: struct格式缓存，用于性能优化
+        _bitfield_plans: 位段提取计划缓存
     """
 
     def __init__(self, config: ProtocolConfig):
@@ -55,8 +176,58 @@ class YamlFieldParser:
         """
         self.config = config
         self.type_parsers = self._build_type_parsers()
-        # 性能优化：预缓存 struct 格式对象
-        self._struct_cache = {}  # {(endian, fmt_char, data_len): struct.Struct}
+        # 以下缓存只收录 config 自身持有的定义，在初始化时一次性预编译；
+        # 调用方临时传入的字段/列表每次现算，不会被缓存长期引用。
+        # 解析器创建后配置视为只读，之后修改字段定义不会反映到已编译的结果中。
+        # 字段预编译缓存：{id(字段定义): (字段定义, 解析函数, 整数格式)}
+        self._field_parsers: Dict[int, tuple] = {}
+        # 字段列表开头固定长度部分的字节数缓存：{id(字段列表): (字段列表, 字节数)}
+        self._leading_sizes: Dict[int, tuple] = {}
+        # 字段列表解析计划缓存：{id(字段列表): (字段列表, 计划)}
+        self._fields_plans: Dict[int, tuple] = {}
+        # 固定大小字段组的字节数缓存：{id(字段组): (字段组, 字节数或None)}
+        self._static_sizes: Dict[int, tuple] = {}
+        # 位段提取计划缓存：{(id(位段定义来源), 总位数): (来源对象, 提取计划)}
+        self._bitfield_plans: Dict[tuple, tuple] = {}
+
+        for type_def in config.types.values():
+            if type_def.base == "bitfield" and type_def.bytes:
+                self._cache_bitfield_plan(type_def, type_def, type_def.bytes * 8)
+        for fields in config.cmds.values():
+            self._precompile(fields)
+
+    def _precompile(self, fields: List[Union[Field, Group]]) -> None:
+        """预编译配置持有的字段列表（含嵌套字段组），结果按对象 id 缓存
+
+        配置本身有误（如长度不是整数）时该项不缓存，留到解析时按原路径现算并报错，
+        不影响其他命令的初始化。
+        """
+        for field_item in fields:
+            if isinstance(field_item, Group):
+                # 先编译组内字段，外层组的大小计算可直接命中内层缓存
+                self._precompile(field_item.fields)
+                self._try_cache(
+                    self._static_sizes, field_item, lambda g: (g, self._get_static_size(g))
+                )
+            elif field_item.type in self.config.types:
+                self._try_cache(
+                    self._field_parsers, field_item, lambda f: (f, *self._compile_field(f))
+                )
+                type_def = self.config.types[field_item.type]
+                if type_def.base == "bitfield" and isinstance(field_item.len, int):
+                    source = field_item if field_item.bit_groups else type_def
+                    self._cache_bitfield_plan(source, type_def, field_item.len * 8)
+
+        self._try_cache(self._leading_sizes, fields, lambda f: (f, self._leading_fields_size(f)))
+        self._try_cache(self._fields_plans, fields, lambda f: (f, self._get_fields_plan(f)))
+
+    @staticmethod
+    def _try_cache(cache: Dict[int, tuple], owner: Any, build: Callable[[Any], tuple]) -> None:
+        """以 id(owner) 缓存 build(owner) 生成的条目，生成失败时跳过"""
+        try:
+            cache[id(owner)] = build(owner)
+        except Exception:
+            pass
 
     def _build_type_parsers(self) -> Dict[str, callable]:
         """构建类型解析器映射"""
@@ -77,51 +248,77 @@ class YamlFieldParser:
             "bitfield": self._parse_bitfield,
         }
 
-    def _get_struct(self, endian: str, fmt_char: str, data_len: int) -> struct.Struct:
-        """获取缓存的 struct.Struct 对象（性能优化）
-
-        Args:
-            endian: 字节序 ('LE' 或 'BE')
-            fmt_char: 格式字符 ('B', 'H', 'L', 'Q' 等)
-            data_len: 数据长度（字节）
-
-        Returns:
-            struct.Struct 对象
-        """
-        key = (endian, fmt_char, data_len)
-        if key not in self._struct_cache:
-            endian_char = "<" if endian == "LE" else ">"
-            self._struct_cache[key] = struct.Struct(f"{endian_char}{fmt_char}")
-        return self._struct_cache[key]
-
     # TODO: 支持按配置动态扩展解析器
 
     def parse_fields(
-        self, data: bytes, fields: List[Union[Field, Group]], context: Dict[str, Any] = None
+        self,
+        data: bytes,
+        fields: List[Union[Field, Group]],
+        context: Dict[str, Any] = None,
+        start: int = 0,
     ) -> Dict[str, Any]:
-        """解析字段列表"""
+        """解析字段列表
+
+        Args:
+            data: 原始数据
+            fields: 字段定义列表
+            context: 字段ID上下文
+            start: 字段列表在 data 中的起始偏移（循环组内部使用，避免切片复制）
+        """
         if context is None:
             context = {}
 
         result = {}
-        offset = 0
+        offset = start
+        for segment in self._get_fields_plan(fields):
+            if type(segment) is _IntRun:
+                if offset + segment.size <= len(data):
+                    # 连续整数字段：一次解包全部数值
+                    values = segment.unpack(data, offset)
+                    result.update(zip(segment.names, values))
+                    for index, field_id in segment.ids:
+                        context[field_id] = values[index]
+                    offset += segment.size
+                    continue
+                # 数据不足：逐字段解析以生成占位信息
+                segment = segment.fields
+            offset = self._parse_items(data, segment, context, offset, result)
 
-        for field_item in fields:
+        return result
+
+    def _parse_items(
+        self,
+        data: bytes,
+        items: List[Union[Field, Group]],
+        context: Dict[str, Any],
+        offset: int,
+        result: Dict[str, Any],
+    ) -> int:
+        """逐项解析字段/字段组并写入 result，返回解析后的偏移"""
+        # 开头连续的固定长度字段只做一次整体长度检查，检查范围内的字段不再逐个检查
+        checked_end = offset + self._leading_fields_size(items)
+        if checked_end > len(data):
+            checked_end = offset
+
+        for field_item in items:
             if isinstance(field_item, Field):
-                try:
-                    # 解析普通字段
-                    field_result, consumed = self._parse_field(data[offset:], field_item, context)
-                except FieldDataMissing as missing_error:
-                    logger.info(f"字段 '{field_item.name}' 数据不足，使用占位信息: {missing_error}")
-                    result[field_item.name] = MISSING_FIELD_PLACEHOLDER
-                    offset += field_item.len
-                    continue
+                if offset + field_item.len <= checked_end:
+                    field_result, consumed = self._parse_field_at(data, field_item, offset)
+                else:
+                    try:
+                        # 解析普通字段
+                        field_result, consumed = self._parse_field(
+                            data, field_item, context, offset
+                        )
+                    except FieldDataMissing as missing_error:
+                        logger.info(
+                            f"字段 '{field_item.name}' 数据不足，使用占位信息: {missing_error}"
+                        )
+                        result[field_item.name] = MISSING_FIELD_PLACEHOLDER
+                        offset += field_item.len
+                        continue
                 # 检查是否需要展平bitfield结果
-                if (
-                    hasattr(field_item, "flatten")
-                    and field_item.flatten
-                    and isinstance(field_result, dict)
-                ):
+                if field_item.flatten and isinstance(field_result, dict):
                     result.update(field_result)
                 else:
                     result[field_item.name] = field_result
@@ -134,41 +331,219 @@ class YamlFieldParser:
 
             elif isinstance(field_item, Group):
                 # 解析字段组（循环）
-                group_result, consumed = self._parse_group(data[offset:], field_item, context)
+                group_result, consumed = self._parse_group(data, field_item, context, offset)
                 result.update(group_result)
                 offset += consumed
 
-        return result
+        return offset
 
-    def _parse_field(self, data: bytes, field: Field, context: Dict[str, Any]) -> tuple:
-        """解析单个字段"""
-        if len(data) < field.len:
+    def _get_fields_plan(self, fields: List[Union[Field, Group]]) -> tuple:
+        """获取字段列表的解析计划，配置持有的列表取预编译结果
+
+        计划由若干段组成：端序相同、无缩放/枚举的连续整数字段（至少两个）合并为一个
+        _IntRun，用一次 struct 解包；其余字段和字段组按原顺序组成列表逐项解析。
+        """
+        cached = self._fields_plans.get(id(fields))
+        if cached is not None and cached[0] is fields:
+            return cached[1]
+
+        # 各项的整数格式：可合并解包的整数字段为 (是否有符号, 字节数, 是否小端)，其余为 None
+        formats = []
+        for field_item in fields:
+            int_format = None
+            if (
+                isinstance(field_item, Field)
+                and not field_item.flatten
+                and field_item.type in self.config.types
+            ):
+                int_format = self._get_field_entry(field_item)[2]
+            formats.append(int_format)
+
+        plan = []
+        pending: List[Union[Field, Group]] = []
+        i = 0
+        while i < len(fields):
+            # 向后扩展端序相同的连续整数字段
+            j = i
+            if formats[i] is not None:
+                while (
+                    j + 1 < len(fields)
+                    and formats[j + 1] is not None
+                    and formats[j + 1][2] == formats[i][2]
+                ):
+                    j += 1
+            if j > i:
+                if pending:
+                    plan.append(pending)
+                    pending = []
+                plan.append(self._build_int_run(fields[i : j + 1], formats[i : j + 1]))
+            else:
+                pending.append(fields[i])
+            i = j + 1
+        if pending:
+            plan.append(pending)
+
+        return tuple(plan)
+
+    @staticmethod
+    def _build_int_run(run_fields: List[Field], formats: List[tuple]) -> "_IntRun":
+        """由连续整数字段及其整数格式构建合并解包段"""
+        fmt_chars = {1: "B", 2: "H", 4: "I", 8: "Q"}
+        fmt = "<" if formats[0][2] else ">"
+        for signed, size, _ in formats:
+            fmt += fmt_chars[size].lower() if signed else fmt_chars[size]
+        return _IntRun(
+            unpack=struct.Struct(fmt).unpack_from,
+            size=sum(item.len for item in run_fields),
+            names=tuple(item.name for item in run_fields),
+            ids=tuple((index, item.id) for index, item in enumerate(run_fields) if item.id),
+            fields=run_fields,
+        )
+
+    def _parse_field(
+        self, data: bytes, field: Field, context: Dict[str, Any], offset: int = 0
+    ) -> tuple:
+        """解析单个字段，字段数据从 data[offset] 开始"""
+        available = len(data) - offset
+        if available < field.len:
             raise FieldDataMissing(
-                f"Not enough data for field '{field.name}', need {field.len} bytes, got {len(data)}"
+                f"Not enough data for field '{field.name}', need {field.len} bytes, got {available}"
             )
+        return self._parse_field_at(data, field, offset)
 
-        # 获取类型定义
-        if field.type not in self.config.types:
-            raise ValueError(f"Unknown type '{field.type}' for field '{field.name}'")
-
-        type_def = self.config.types[field.type]
-        field_data = data[: field.len]
+    def _parse_field_at(self, data: bytes, field: Field, offset: int) -> tuple:
+        """解析单个字段（调用方已确认 data[offset:] 足够容纳该字段）"""
+        # 获取该字段预编译的解析函数（每个字段定义只编译一次）
+        field_parser = self._get_field_entry(field)[1]
 
-        # 解析基础值
         try:
-            raw_value = self._parse_by_type(field_data, type_def, field)
-            # 应用后处理（缩放、枚举映射等）
-            processed_value = self._post_process_value(raw_value, field)
-            return processed_value, field.len
+            return field_parser(data, offset), field.len
         except FieldDataMissing:
             logger.info(f"字段 '{field.name}' 数据不足，使用占位信息")
-            return MISSING_FIELD_PLACEHOLDER, len(data)
+            return MISSING_FIELD_PLACEHOLDER, len(data) - offset
         except Exception as e:
             logger.warning(f"Failed to parse field '{field.name}': {e}")
-            return field_data.hex().upper(), field.len
+            return data[offset : offset + field.len].hex().upper(), field.len
+
+    def _leading_fields_size(self, fields: List[Union[Field, Group]]) -> int:
+        """字段列表开头连续普通字段（遇到第一个字段组为止）的总字节数，配置持有的列表取缓存"""
+        cached = self._leading_sizes.get(id(fields))
+        if cached is not None and cached[0] is fields:
+            return cached[1]
+
+        size = 0
+        for field_item in fields:
+            if not isinstance(field_item, Field):
+                break
+            size += field_item.len
+        return size
+
+    def _get_field_entry(self, field: Field) -> tuple:
+        """获取字段的编译条目 (字段定义, 解析函数, 整数格式或None)
+
+        配置持有的字段取预编译结果，其余字段现场编译；缓存值同时持有字段对象本身，
+        命中时以 is 校验，避免 id 被回收复用后取错条目。
+        """
+        cached = self._field_parsers.get(id(field))
+        if cached is None or cached[0] is not field:
+            cached = (field, *self._compile_field(field))
+        return cached
+
+    def _compile_field(self, field: Field) -> tuple:
+        """为字段生成专用解析函数 (data, offset) -> 后处理后的值
+
+        类型查找、端序判断和解包函数选择在此一次完成，解析时不再逐字段分派。
+        返回 (解析函数, 整数格式)：无缩放、无枚举的 1/2/4/8 字节整数字段的整数格式为
+        (是否有符号, 字节数, 是否小端)，供循环组批量解包使用；其余字段为 None。
+        """
+        if field.type not in self.config.types:
+            raise ValueError(f"Unknown type '{field.type}' for field '{field.name}'")
+        type_def = self.config.types[field.type]
+        type_parser = self.type_parsers.get(type_def.base)
+        size = field.len
+        signed = type_def.base == "int"
+        int_format = None
+        unpack = None
+        if type_def.base in ("uint", "int"):
+            little = (field.endian or self.config.meta.default_endian) == "LE"
+            int_format = (signed, size, little)
+            unpack = _INT_UNPACKERS.get(int_format)
+            if unpack is None:
+                int_format = None
+
+        if type_parser is None:
+
+            def read(data: bytes, offset: int) -> Any:
+                raise ValueError(f"Unsupported type base: {type_def.base}")
+
+        elif int_format is not None and size == 1 and not signed:
+            # 单字节无符号整数：按下标取字节即为数值，无需经过 struct
+            def read(data: bytes, offset: int) -> Any:
+                return data[offset]
+
+        elif int_format is not None and size == 1:
+            # 单字节有符号整数：按补码换算
+            def read(data: bytes, offset: int) -> Any:
+                value = data[offset]
+                return value - 256 if value > 127 else value
+
+        elif unpack is not None:
+            # 2/4/8 字节整数直接按偏移解包原始缓冲区
+            def read(data: bytes, offset: int) -> Any:
+                return unpack(data, offset)[0]
+
+        else:
+
+            def read(data: bytes, offset: int) -> Any:
+                return type_parser(data[offset : offset + size], type_def, field)
+
+        # 无缩放、无枚举的字段跳过后处理
+        enum_def = self.config.enums.get(field.enum) if field.enum else None
+        if field.scale is None and enum_def is None:
+            return read, int_format
 
-    def _parse_group(self, data: bytes, group: Group, context: Dict[str, Any]) -> tuple:
-        """解析字段组（循环）"""
+        if field.scale is None:
+            # 仅有枚举：直接持有枚举值表，一次 get 完成映射
+            enum_names = enum_def.values
+
+            def parse_enum(data: bytes, offset: int) -> Any:
+                raw_value = read(data, offset)
+                name = enum_names.get(raw_value)
+                if name is None:
+                    return raw_value
+                return {"value": raw_value, "name": name}
+
+            return parse_enum, None
+
+        # 有缩放：缩放参数只计算一次
+        try:
+            scale_params = _scale_quantize_params(field.scale)
+        except Exception as e:
+            # 无法处理的缩放因子只影响本字段：解析时抛出，由调用方回退为十六进制
+            message = f"Invalid scale {field.scale!r}: {e}"
+
+            def parse_invalid_scale(data: bytes, offset: int) -> Any:
+                raise ValueError(message)
+
+            return parse_invalid_scale, None
+
+        enum_names = enum_def.values if enum_def is not None else None
+
+        def parse_scaled(data: bytes, offset: int) -> Any:
+            raw_value = read(data, offset)
+            processed_value = raw_value
+            if isinstance(raw_value, (int, float)):
+                processed_value = _scale_value(raw_value, scale_params)
+            if enum_names is not None and raw_value in enum_names:
+                processed_value = {"value": raw_value, "name": enum_names[raw_value]}
+            return processed_value
+
+        return parse_scaled, None
+
+    def _parse_group(
+        self, data: bytes, group: Group, context: Dict[str, Any], start: int = 0
+    ) -> tuple:
+        """解析字段组（循环），组数据从 data[start] 开始，返回结果和消耗的字节数"""
         result = {}
         offset = 0
 
@@ -182,15 +557,26 @@ class YamlFieldParser:
         else:
             raise ValueError("Group must specify either repeat_by or repeat_const")
 
-        # 循环解析
-        group_items = []
-        for i in range(repeat_count):
-            item_result = self.parse_fields(data[offset:], group.fields, context.copy())
-            group_items.append(item_result)
+        # 单个整数字段的循环组：一次解包全部数值，无需逐项解析
+        values = None
+        if len(group.fields) == 1 and isinstance(group.fields[0], Field):
+            values = self._unpack_int_array(data, start, group.fields[0], repeat_count)
 
-            # 计算这一轮消耗的字节数
+        if values is not None:
+            name = group.fields[0].name
+            group_items = [{name: value} for value in values]
+            offset = group.fields[0].len * repeat_count
+        else:
+            # 每轮消耗的字节数只取决于外层上下文，循环前计算一次
             item_size = sum(self._calculate_field_size(f, context) for f in group.fields)
-            offset += item_size
+
+            # 循环解析：循环次数已知，结果列表预先分配后按下标填充
+            group_items = [None] * repeat_count
+            for i in range(repeat_count):
+                group_items[i] = self.parse_fields(
+                    data, group.fields, context.copy(), start + offset
+                )
+                offset += item_size
 
         # 生成组结果键名（基于第一个字段名）
         if group.fields:
@@ -207,6 +593,18 @@ class YamlFieldParser:
 
         return result, offset
 
+    def _unpack_int_array(
+        self, data: bytes, start: int, field: Field, count: int
+    ) -> Optional[tuple]:
+        """批量解包循环组中的整数字段，不适用（有缩放/枚举、数据不足等）时返回 None"""
+        if count < 2 or len(data) - start < field.len * count:
+            return None
+
+        int_format = self._get_field_entry(field)[2]
+        if int_format is None:
+            return None
+        return _int_array_unpacker(*int_format, count)(data, start)
+
     def _get_first_field_name(self, field_item: Union[Field, Group]) -> str:
         """获取第一个字段的名称"""
         if isinstance(field_item, Field):
@@ -223,6 +621,11 @@ class YamlFieldParser:
         if isinstance(field_item, Field):
             return field_item.len
         elif isinstance(field_item, Group):
+            # 固定次数循环且不含动态循环的组大小与上下文无关，直接取缓存
+            static_size = self._get_static_size(field_item)
+            if static_size is not None:
+                return static_size
+
             # 计算组内所有字段的大小
             item_size = sum(self._calculate_field_size(f, context) for f in field_item.fields)
 
@@ -236,74 +639,76 @@ class YamlFieldParser:
         else:
             return 0
 
-    def _parse_by_type(self, data: bytes, type_def: TypeDef, field: Field) -> Any:
-        """根据类型定义解析数据"""
-        parser = self.type_parsers.get(type_def.base)
-        if not parser:
-            raise ValueError(f"Unsupported type base: {type_def.base}")
+    def _get_static_size(self, group: Group) -> Optional[int]:
+        """组的固定大小（含嵌套组），依赖 repeat_by 时返回 None，配置持有的组取缓存"""
+        cached = self._static_sizes.get(id(group))
+        if cached is not None and cached[0] is group:
+            return cached[1]
+
+        size = None
+        if not group.repeat_by:
+            item_size = 0
+            for field_item in group.fields:
+                if isinstance(field_item, Field):
+                    item_size += field_item.len
+                elif isinstance(field_item, Group):
+                    nested_size = self._get_static_size(field_item)
+                    if nested_size is None:
+                        break
+                    item_size += nested_size
+            else:
+                size = item_size * (group.repeat_const or 1)
 
-        return parser(data, type_def, field)
+        return size
 
-    def _parse_uint(self, data: bytes, type_def: TypeDef, field: Field) -> int:
-        """解析无符号整数"""
+    def _parse_uint(self, data: bytes, type_def: TypeDef, field: Field, offset: int = 0) -> int:
+        """解析无符号整数，从 data[offset] 开始读取 field.len 字节"""
         endian = field.endian or self.config.meta.default_endian
+        unpack = _INT_UNPACKERS.get((False, field.len, endian == "LE"))
+        if unpack is None:
+            raise ValueError(f"Unsupported uint size: {field.len} bytes")
+        return unpack(data, offset)[0]
 
-        # 使用缓存的 struct 对象（性能优化）
-        if len(data) == 1:
-            return self._get_struct(endian, "B", 1).unpack(data)[0]
-        elif len(data) == 2:
-            return self._get_struct(endian, "H", 2).unpack(data)[0]
-        elif len(data) == 4:
-            return self._get_struct(endian, "L", 4).unpack(data)[0]
-        elif len(data) == 8:
-            return self._get_struct(endian, "Q", 8).unpack(data)[0]
-        else:
-            raise ValueError(f"Unsupported uint size: {len(data)} bytes")
-
-    def _parse_int(self, data: bytes, type_def: TypeDef, field: Field) -> int:
-        """解析有符号整数"""
+    def _parse_int(self, data: bytes, type_def: TypeDef, field: Field, offset: int = 0) -> int:
+        """解析有符号整数，从 data[offset] 开始读取 field.len 字节"""
         endian = field.endian or self.config.meta.default_endian
-
-        # 使用缓存的 struct 对象（性能优化）
-        if len(data) == 1:
-            return self._get_struct(endian, "b", 1).unpack(data)[0]
-        elif len(data) == 2:
-            return self._get_struct(endian, "h", 2).unpack(data)[0]
-        elif len(data) == 4:
-            return self._get_struct(endian, "l", 4).unpack(data)[0]
-        elif len(data) == 8:
-            return self._get_struct(endian, "q", 8).unpack(data)[0]
-        else:
-            raise ValueError(f"Unsupported int size: {len(data)} bytes")
+        unpack = _INT_UNPACKERS.get((True, field.len, endian == "LE"))
+        if unpack is None:
+            raise ValueError(f"Unsupported int size: {field.len} bytes")
+        return unpack(data, offset)[0]
 
     def _parse_str(self, data: bytes, type_def: TypeDef, field: Field) -> str:
         """解析字符串"""
         encoding = type_def.encoding or "ASCII"
+        codec_name, codec_decode, ascii_compatible = _resolve_codec(encoding)
+        # 只移除末尾的填充空字节：rstrip 从尾部扫描后切片，不必复制整段数据
+        text = data.rstrip(b"\x00")
+        # 纯ASCII内容（最常见）直接走ASCII解码，isascii 为C层逐字扫描
+        if ascii_compatible and text.isascii():
+            return text.decode("ascii")
         try:
-            # 移除末尾的空字节
-            clean_data = data.rstrip(b"\x00")
-            return clean_data.decode(encoding)
+            if codec_decode is None:
+                return text.decode(codec_name)
+            return codec_decode(text)[0]
         except UnicodeDecodeError:
             logger.warning(
                 f"Failed to decode string field '{field.name}' with {encoding}, using hex"
             )
-            return binascii.hexlify(data).decode("ascii")
+            return data.hex().upper()
 
     def _parse_hex(self, data: bytes, type_def: TypeDef, field: Field) -> str:
         """解析十六进制字符串"""
-        return binascii.hexlify(data).decode("ascii").upper()
+        return data.hex().upper()
 
     def _parse_bcd(self, data: bytes, type_def: TypeDef, field: Field) -> str:
-        """解析BCD码"""
-        result = ""
-        for byte in data:
-            high = (byte >> 4) & 0x0F
-            low = byte & 0x0F
-            if high <= 9:
-                result += str(high)
-            if low <= 9:
-                result += str(low)
-        return result
+        """解析BCD码
+
+        每个半字节对应一个十六进制字符，无效半字节（A-F）直接丢弃。
+        """
+        digits = data.hex()
+        if digits.isdigit():
+            return digits
+        return digits.translate(_BCD_INVALID_NIBBLES)
 
     def _parse_cp56time2a(self, data: bytes, type_def: TypeDef, field: Field) -> str:
         """解析CP56Time2a时间格式"""
@@ -312,24 +717,24 @@ class YamlFieldParser:
 
         try:
             # CP56Time2a格式：毫秒(2) + 分钟(1) + 小时(1) + 日(1) + 月(1) + 年(1)
-            ms = struct.unpack("<H", data[0:2])[0]
-            minute = data[2] & 0x3F  # 低6位
-            hour = data[3] & 0x1F  # 低5位
-            day = data[4] & 0x1F  # 低5位
-            month = data[5] & 0x0F  # 低4位
-            year = data[6] & 0x7F  # 低7位 (相对于2000年)
-
-            # 构造时间
-            actual_year = 2000 + year
-            second = ms // 1000
-            millisecond = ms % 1000
-
-            dt = datetime(actual_year, month, day, hour, minute, second, millisecond * 1000)
+            ms, minute, hour, day, month, year = _CP56_UNPACK(data)
+            second, millisecond = divmod(ms, 1000)
+
+            # 高位为 IV/SU/星期等标志位，只取数值位；年份相对于2000年
+            dt = datetime(
+                2000 + (year & 0x7F),
+                month & 0x0F,
+                day & 0x1F,
+                hour & 0x1F,
+                minute & 0x3F,
+                second,
+                millisecond * 1000,
+            )
             return dt.isoformat()
 
         except (ValueError, OverflowError) as e:
             logger.warning(f"Failed to parse CP56Time2a: {e}, returning hex")
-            return binascii.hexlify(data).decode("ascii").upper()
+            return data.hex().upper()
 
     def _parse_bcd_time7(self, data: bytes, type_def: TypeDef, field: Field) -> str:
         """解析7字节BCD时间格式 (YYYYMMDDhhmmss，最后1字节为空)
@@ -340,20 +745,18 @@ class YamlFieldParser:
             raise ValueError(f"BCD时间需要至少7字节，实际{len(data)}字节")
 
         try:
-            # 解析BCD码
-            year = self._bcd_to_int(data[0:2])
-            month = self._bcd_byte_to_int(data[2])
-            day = self._bcd_byte_to_int(data[3])
-            hour = self._bcd_byte_to_int(data[4])
-            minute = self._bcd_byte_to_int(data[5])
-            second = self._bcd_byte_to_int(data[6])
-
-            dt = datetime(year, month, day, hour, minute, second)
+            # 查表一次性把7个BCD字节转换为对应的两位十进制数
+            values = data[:7].translate(_BCD_TO_INT)
+            if _BCD_INVALID_BYTE in values:
+                raise ValueError(f"无效BCD字节: {data[:7].hex().upper()}")
+
+            year_high, year_low, month, day, hour, minute, second = values
+            dt = datetime(year_high * 100 + year_low, month, day, hour, minute, second)
             return dt.strftime("%Y-%m-%d %H:%M:%S")
 
         except (ValueError, OverflowError) as e:
             logger.warning(f"解析BCD时间失败: {e}，返回原始hex")
-            return binascii.hexlify(data).decode("ascii").upper()
+            return data.hex().upper()
 
     def _parse_bcd_time8(self, data: bytes, type_def: TypeDef, field: Field) -> str:
         """解析8字节BCD时间格式 (YYYYMMDDhhmmss + 1字节空)
@@ -371,40 +774,43 @@ class YamlFieldParser:
         if len(data) != 4:
             raise ValueError(f"Unix时间戳需要4字节，实际{len(data)}字节")
 
-        try:
-            endian = field.endian or self.config.meta.default_endian
-            fmt = "<L" if endian == "LE" else ">L"
-            timestamp = struct.unpack(fmt, data)[0]
-
-            if timestamp == 0:
-                return "1970-01-01 00:00:00"
-
-            dt = datetime.fromtimestamp(timestamp)
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
+        endian = field.endian or self.config.meta.default_endian
+        timestamp = _INT_UNPACKERS[(False, 4, endian == "LE")](data)[0]
+        if timestamp == 0:
+            return "1970-01-01 00:00:00"
 
+        minute, second = divmod(timestamp, 60)
+        try:
+            prefix = _local_minute_prefix(minute)
+            if prefix is None:
+                return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+            return f"{prefix}{second:02d}"
         except (ValueError, OverflowError, OSError) as e:
             logger.warning(f"解析Unix时间戳失败: {e}，返回原始值")
-            return str(struct.unpack("<L", data)[0])
+            return str(timestamp)
 
     def _parse_unix_time_ms(self, data: bytes, type_def: TypeDef, field: Field) -> str:
         """解析Unix时间戳（毫秒）"""
         if len(data) != 8:
             raise ValueError(f"Unix毫秒时间戳需要8字节，实际{len(data)}字节")
 
-        try:
-            endian = field.endian or self.config.meta.default_endian
-            fmt = "<Q" if endian == "LE" else ">Q"
-            timestamp_ms = struct.unpack(fmt, data)[0]
-
-            if timestamp_ms == 0:
-                return "1970-01-01 00:00:00.000"
-
-            dt = datetime.fromtimestamp(timestamp_ms / 1000.0)
-            return dt.strftime("%Y-%m-%d %H:%M:%S.") + f"{timestamp_ms % 1000:03d}"
+        endian = field.endian or self.config.meta.default_endian
+        timestamp_ms = _INT_UNPACKERS[(False, 8, endian == "LE")](data)[0]
+        if timestamp_ms == 0:
+            return "1970-01-01 00:00:00.000"
 
+        # 整数拆分秒和毫秒，避免浮点除法的舍入误差
+        seconds, millis = divmod(timestamp_ms, 1000)
+        minute, second = divmod(seconds, 60)
+        try:
+            prefix = _local_minute_prefix(minute)
+            if prefix is None:
+                local_time = datetime.fromtimestamp(seconds)
+                return local_time.strftime("%Y-%m-%d %H:%M:%S.") + f"{millis:03d}"
+            return f"{prefix}{second:02d}.{millis:03d}"
         except (ValueError, OverflowError, OSError) as e:
             logger.warning(f"解析Unix毫秒时间戳失败: {e}，返回原始值")
-            return str(struct.unpack("<Q", data)[0])
+            return str(timestamp_ms)
 
     def _parse_bin_time7(self, data: bytes, type_def: TypeDef, field: Field) -> str:
         """解析7字节BIN时间格式（协议附录D格式）
@@ -432,137 +838,88 @@ class YamlFieldParser:
 
         except (ValueError, OverflowError) as e:
             logger.warning(f"解析BIN时间失败: {e}，返回原始hex")
-            return binascii.hexlify(data).decode("ascii").upper()
-
-    def _bcd_byte_to_int(self, byte: int) -> int:
-        """单字节BCD转整数"""
-        high = (byte >> 4) & 0x0F
-        low = byte & 0x0F
-        if high > 9 or low > 9:
-            raise ValueError(f"无效BCD字节: 0x{byte:02X}")
-        return high * 10 + low
-
-    def _bcd_to_int(self, data: bytes) -> int:
-        """多字节BCD转整数（大端序）"""
-        result = 0
-        for byte in data:
-            result = result * 100 + self._bcd_byte_to_int(byte)
-        return result
+            return data.hex().upper()
 
     def _parse_binary_str(self, data: bytes, type_def: TypeDef, field: Field) -> str:
         """解析二进制字符串（作为十六进制显示）"""
-        return binascii.hexlify(data).decode("ascii").upper()
+        return data.hex().upper()
 
     def _parse_bitset(self, data: bytes, type_def: TypeDef, field: Field) -> Dict[str, bool]:
-        """解析位段"""
-        if not type_def.bits:
-            return {"raw": binascii.hexlify(data).decode("ascii").upper()}
-
-        # 将字节转换为整数
-        if len(data) == 1:
-            value = struct.unpack("B", data)[0]
-        elif len(data) == 2:
-            endian = field.endian or self.config.meta.default_endian
-            fmt = "<H" if endian == "LE" else ">H"
-            value = struct.unpack(fmt, data)[0]
-        else:
-            # 对于更大的位段，当作十六进制处理
-            return {"raw": binascii.hexlify(data).decode("ascii").upper()}
+        """解析位段
 
-        result = {}
-        for i, bit_def in enumerate(type_def.bits):
-            if i < len(data) * 8:  # 确保不超出数据范围
-                bit_value = (value >> i) & 1
-                result[bit_def["name"]] = bool(bit_value)
+        任意字节数的数据都按位展开（超过2字节时不再回退为十六进制）；
+        未定义位或数据为空时返回 {"raw": 十六进制}。
+        """
+        if not type_def.bits or not data:
+            return {"raw": data.hex().upper()}
 
-        return result
+        # 将字节转换为整数（任意字节数）
+        endian = field.endian or self.config.meta.default_endian
+        value = self._bytes_to_int(data, endian)
+
+        # 一次性展开为低位在前的位串，zip 自动截断超出数据范围的位定义
+        bits = format(value, f"0{len(data) * 8}b")[::-1]
+        return {bit_def["name"]: flag == "1" for bit_def, flag in zip(type_def.bits, bits)}
 
     def _parse_bitfield(self, data: bytes, type_def: TypeDef, field: Field) -> Dict[str, Any]:
         """解析位段字段"""
-        # 优先使用字段级位段定义，回退到类型级定义（向后兼容）
-        groups = field.get_bitfield_groups() if field.bit_groups else type_def.get_bitfield_groups()
-
-        if not groups:
-            return {"raw": binascii.hexlify(data).decode("ascii").upper()}
+        plan = self._get_bitfield_plan(type_def, field, len(data) * 8)
+        if not plan:
+            return {"raw": data.hex().upper()}
 
         # 将字节数据转换为整数（支持多字节）
         endian = field.endian or self.config.meta.default_endian
         value = self._bytes_to_int(data, endian)
 
         result = {}
+        for name, shift, mask, enum_values in plan:
+            group_value = (value >> shift) & mask
+            if enum_values is None:
+                result[name] = group_value
+            elif group_value in enum_values:
+                result[name] = enum_values[group_value]
+            else:
+                result[name] = f"Unknown({group_value})"
+
+        return result
+
+    def _get_bitfield_plan(self, type_def: TypeDef, field: Field, total_bits: int) -> tuple:
+        """获取位段提取计划 ((名称, 右移位数, 掩码, 枚举值表或None), ...)
 
+        配置持有的位段定义取预编译结果，其余现场计算。
+        缓存值同时持有定义对象本身，命中时以 is 校验，避免 id 被回收复用后取错计划。
+        """
+        # 优先使用字段级位段定义，回退到类型级定义（向后兼容）
+        source = field if field.bit_groups else type_def
+        cached = self._bitfield_plans.get((id(source), total_bits))
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        return self._build_bitfield_plan(source, type_def, total_bits)
+
+    def _cache_bitfield_plan(self, source: Any, type_def: TypeDef, total_bits: int) -> None:
+        """预编译配置持有的位段定义（字段或类型）在给定总位数下的提取计划，计算失败时跳过"""
+        try:
+            plan = self._build_bitfield_plan(source, type_def, total_bits)
+        except Exception:
+            return
+        self._bitfield_plans[(id(source), total_bits)] = (source, plan)
+
+    def _build_bitfield_plan(self, source: Any, type_def: TypeDef, total_bits: int) -> tuple:
+        """计算位段提取计划：位序换算、掩码和枚举查找"""
+        groups = source.get_bitfield_groups()
         # 获取位序信息（优先从type_def，默认lsb0）
-        bit_order = getattr(type_def, "order", "lsb0")
+        msb0 = getattr(type_def, "order", "lsb0") == "msb0"
 
+        plan = []
         for group in groups:
-            # 提取位段值
-            if bit_order == "msb0":
-                # MSB0: 最高位为第0位
-                total_bits = len(data) * 8
-                actual_start = total_bits - group.start_bit - group.width
-            else:
-                # LSB0: 最低位为第0位 (默认)
-                actual_start = group.start_bit
-
-            # 创建掩码并提取值
-            mask = (1 << group.width) - 1
-            group_value = (value >> actual_start) & mask
-
-            # 应用枚举映射
-            if group.enum and group.enum in self.config.enums:
-                enum_def = self.config.enums[group.enum]
-                if group_value in enum_def.values:
-                    result[group.name] = enum_def.values[group_value]
-                else:
-                    result[group.name] = f"Unknown({group_value})"
-            else:
-                result[group.name] = group_value
+            # MSB0: 最高位为第0位；LSB0: 最低位为第0位 (默认)
+            shift = total_bits - group.start_bit - group.width if msb0 else group.start_bit
+            enum_def = self.config.enums.get(group.enum) if group.enum else None
+            enum_values = enum_def.values if enum_def else None
+            plan.append((group.name, shift, (1 << group.width) - 1, enum_values))
 
-        return result
+        return tuple(plan)
 
     def _bytes_to_int(self, data: bytes, endian: str) -> int:
         """将字节数据转换为整数"""
-        if endian == "LE":
-            # 小端序
-            value = 0
-            for i, byte in enumerate(data):
-                value |= byte << (i * 8)
-        else:
-            # 大端序
-            value = 0
-            for byte in data:
-                value = (value << 8) | byte
-        return value
-
-    def _get_decimal_places(self, scale: float) -> int:
-        """根据缩放因子确定小数位数"""
-        if scale == 0:
-            return 0
-        # 将 scale 转换为字符串，计算小数位数
-        scale_str = f"{scale:.10f}".rstrip("0").rstrip(".")
-        if "." in scale_str:
-            return len(scale_str.split(".")[1])
-        return 0
-
-    def _post_process_value(self, raw_value: Any, field: Field) -> Any:
-        """后处理字段值（缩放、枚举映射等）"""
-        processed_value = raw_value
-
-        # 应用缩放因子，使用 Decimal 进行精确计算
-        if field.scale is not None and isinstance(raw_value, (int, float)):
-            # 使用 Decimal 进行精确计算
-            decimal_value = Decimal(str(raw_value)) * Decimal(str(field.scale))
-            # 根据 scale 确定小数位数并格式化
-            decimal_places = self._get_decimal_places(field.scale)
-            # 四舍五入到指定小数位数
-            processed_value = float(
-                decimal_value.quantize(Decimal(10) ** -decimal_places, rounding=ROUND_HALF_UP)
-            )
-
-        # 应用枚举映射
-        if field.enum and field.enum in self.config.enums:
-            enum_def = self.config.enums[field.enum]
-            if raw_value in enum_def.values:
-                processed_value = {"value": raw_value, "name": enum_def.values[raw_value]}
-
-        return processed_value
+        return int.from_bytes(data, "little" if endian == "LE" else "big")
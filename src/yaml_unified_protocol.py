@@ -14,7 +14,6 @@ from src.protocol_data_extractor import ProtocolDataExtractor
 from src.protocol_output_formatter import ProtocolOutputFormatter
 from src.protocol_parser import ProtocolParser
 from src.yaml_cmdformat import YamlCmdFormat
-from src.yaml_field_parser import YamlFieldParser
 
 logger = logging.getLogger(__name__)
 
@@ -37,8 +36,9 @@ class YamlUnifiedProtocol:
         self.yaml_format = YamlCmdFormat(protocol_yaml_path)
         self.yaml_config = self.yaml_format.config
 
-        # 创建字段解析器（保留用于向后兼容）
-        self.field_parser = YamlFieldParser(self.yaml_format.config)
+        # 字段解析器（保留用于向后兼容）：复用命令格式管理器中的实例，
+        # 已编译的字段解析函数和解析计划只需生成一次
+        self.field_parser = self.yaml_format.field_parser
 
         # 创建三个核心组件
         self.extractor = ProtocolDataExtractor(self.yaml_config.frame_head)
@@ -142,16 +142,19 @@ class YamlUnifiedProtocol:
             should_stop_callback=self._check_should_stop,
         )
 
-    def screen_parse_data(self, parse_data: List[Dict[str, Any]]) -> Optional[str]:
+    def screen_parse_data(
+        self, parse_data: List[Dict[str, Any]], output_dir: str = "parsed_log"
+    ) -> Optional[str]:
         """筛选并打印解析结果，同时输出到特定的解析文件（向后兼容接口）
 
         Args:
             parse_data: 解析后的数据列表
+            output_dir: 输出目录，默认为当前工作目录下的 parsed_log
 
         Returns:
             输出文件的绝对路径，如果没有数据则返回 None
         """
-        return self.formatter.format_and_save(parse_data, self.perf_stats)
+        return self.formatter.format_and_save(parse_data, self.perf_stats, output_dir)
 
     def extract_data_from_file(self, file_path: str) -> List[Dict[str, str]]:
         """从文件中提取数据（向后兼容接口）
@@ -164,9 +167,12 @@ class YamlUnifiedProtocol:
         """
         return self.extractor.extract_from_file(file_path)
 
-    def run(self) -> Optional[str]:
+    def run(self, output_dir: str = "parsed_log") -> Optional[str]:
         """运行协议解析
 
+        Args:
+            output_dir: 解析结果输出目录，默认为当前工作目录下的 parsed_log
+
         Returns:
             解析结果文件的绝对路径，如果解析失败或无数据则返回 None
         """
@@ -204,7 +210,7 @@ class YamlUnifiedProtocol:
             # 筛选并打印结果
             screen_start = perf_counter()
             self._emit_progress(85, 100)  # 开始输出
-            output_path = self.screen_parse_data(parsed_data)
+            output_path = self.screen_parse_data(parsed_data, output_dir)
             screen_duration = perf_counter() - screen_start
             self._record_phase("screen", screen_duration)
             self._record_phase("total", perf_counter() - total_start)
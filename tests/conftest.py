@@ -3,38 +3,47 @@ pytest 配置文件和共享 fixtures
 为所有测试提供公共的测试数据和工具函数
 """
 
+import os
 import sys
 from pathlib import Path
-from typing import Generator
+from typing import Dict, Generator, List
 
 import pytest
 
+PROJECT_ROOT = Path(__file__).parent.parent
+CONFIGS_DIR = PROJECT_ROOT / "configs"
+V8_CONFIG_PATH = CONFIGS_DIR / "v8" / "protocol.yaml"
+XIAOJU_CONFIG_PATH = CONFIGS_DIR / "xiaoju" / "protocol.yaml"
+BUNDLED_PROTOCOLS = ("v8", "xiaoju", "yunwei", "sinexcel")
+
 # 添加src目录到路径
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from src.yaml_config import ProtocolConfig, yaml_loader
 
 
 @pytest.fixture
 def project_root() -> Path:
     """项目根目录"""
-    return Path(__file__).parent.parent
+    return PROJECT_ROOT
 
 
 @pytest.fixture
-def configs_dir(project_root: Path) -> Path:
+def configs_dir() -> Path:
     """配置文件目录"""
-    return project_root / "configs"
+    return CONFIGS_DIR
 
 
 @pytest.fixture
-def v8_config_path(configs_dir: Path) -> Path:
+def v8_config_path() -> Path:
     """V8协议配置文件路径"""
-    return configs_dir / "v8" / "protocol.yaml"
+    return V8_CONFIG_PATH
 
 
 @pytest.fixture
-def xiaoju_config_path(configs_dir: Path) -> Path:
+def xiaoju_config_path() -> Path:
     """小桔协议配置文件路径"""
-    return configs_dir / "xiaoju" / "protocol.yaml"
+    return XIAOJU_CONFIG_PATH
 
 
 @pytest.fixture
@@ -49,6 +58,49 @@ def sinexcel_config_path(configs_dir: Path) -> Path:
     return configs_dir / "sinexcel" / "protocol.yaml"
 
 
+@pytest.fixture(scope="session", autouse=True)
+def config_disk_cache(pytestconfig: pytest.Config) -> None:
+    """协议配置解析结果缓存到 pytest 缓存目录（.pytest_cache），跨测试运行复用
+
+    使用 -p no:cacheprovider 运行时不启用。
+    """
+    cache = getattr(pytestconfig, "cache", None)
+    if cache is not None:
+        yaml_loader.enable_disk_cache(cache.mkdir("protocol_configs"))
+
+
+@pytest.fixture(scope="session")
+def configs() -> Dict[str, ProtocolConfig]:
+    """所有内置协议配置，按协议名索引（整个测试会话只加载一次）"""
+    # 一次目录扫描得到现有协议，避免逐个 stat
+    with os.scandir(CONFIGS_DIR) as entries:
+        present = {entry.name for entry in entries if entry.is_dir()}
+
+    return {
+        protocol: yaml_loader.load_protocol_config(CONFIGS_DIR / protocol / "protocol.yaml")
+        for protocol in BUNDLED_PROTOCOLS
+        if protocol in present
+    }
+
+
+@pytest.fixture(scope="session")
+def validation_results(configs: Dict[str, ProtocolConfig]) -> Dict[str, List[str]]:
+    """内置协议配置的基础校验结果，按协议名索引（会话级只校验一次）"""
+    return {protocol: yaml_loader.validate_config(config) for protocol, config in configs.items()}
+
+
+@pytest.fixture(scope="session")
+def v8_config(configs: Dict[str, ProtocolConfig]) -> ProtocolConfig:
+    """V8协议配置"""
+    return configs["v8"]
+
+
+@pytest.fixture(scope="session")
+def xiaoju_config(configs: Dict[str, ProtocolConfig]) -> ProtocolConfig:
+    """小桔协议配置"""
+    return configs["xiaoju"]
+
+
 @pytest.fixture
 def input_logs_dir(project_root: Path) -> Path:
     """输入日志目录"""
@@ -177,4 +229,4 @@ def cleanup_global_state():
     except ImportError:
         pass  # 如果 MyLogger 不存在，忽略
 
-
+
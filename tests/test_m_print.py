@@ -88,6 +88,17 @@ class TestComLogger:
 
         logger.close_file()
 
+    def test_com_print_hex_uppercase(self, tmp_path):
+        """测试通信日志十六进制数据为大写、空格分隔"""
+        logger = ComLogger(log_file=12, log_mode=LogMode.PRINT_ONLY, log_dir=str(tmp_path))
+
+        with patch("builtins.print") as mock_print:
+            logger.com_print(b"\xab\x0c\xff", cmd=0x01, addr=1)
+
+            assert "AB 0C FF" in str(mock_print.call_args)
+
+        logger.close_file()
+
     def test_com_logger_print_and_save(self, tmp_path):
         """测试 ComLogger 打印并保存模式"""
         logger = ComLogger(
@@ -9,7 +9,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from src.protocol_parser import ProtocolParser
+from src.protocol_parser import ProtocolParser, _parse_log_timestamp
 
 
 class TestProtocolParserInit:
@@ -352,6 +352,15 @@ class TestCheckTimeFilter:
         # 无效格式应该默认通过
         assert parser._check_time_filter("invalid") is True
 
+    @pytest.mark.parametrize(
+        "timestamp_str",
+        ["2024-01-28 10:30:45.123", "2024-01-28 10:30:45.12", "2024-01-28 10:30:45.123456"],
+    )
+    def test_parse_log_timestamp_matches_strptime(self, timestamp_str):
+        """测试快速时间戳解析与 strptime 结果一致"""
+        expected = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S.%f")
+        assert _parse_log_timestamp(timestamp_str) == expected
+
 
 class TestParseDataGroups:
     """测试数据组解析"""
@@ -510,6 +519,41 @@ class TestParseDataGroups:
         # 数据长度不足，应该被跳过
         assert len(result) == 0
 
+    def test_parse_data_groups_irregular_hex_tokens(self, mock_yaml_format):
+        """测试字节间空白不规整时回退到拆分拼接后解析"""
+        parser = ProtocolParser(mock_yaml_format)
+
+        mock_yaml_format.config.head_len = 4
+        mock_yaml_format.config.tail_len = 2
+        mock_yaml_format.get_head_fields.return_value = [
+            {"name": "cmd", "offset": 2, "length": 2, "endian": "big", "type": "uint"}
+        ]
+        mock_yaml_format.has_cmd.return_value = True
+        mock_yaml_format.parse_cmd_data.return_value = {}
+
+        data_groups = [{"time": "2024-01-28 10:30:45.123", "data": "686 801 02A ABB"}]
+
+        result = parser.parse_data_groups(data_groups)
+
+        assert len(result) == 1
+        assert result[0]["cmd"] == 0x0102
+        mock_yaml_format.parse_cmd_data.assert_called_once_with(0x0102, b"")
+
+    def test_parse_data_groups_progress_throttled(self, mock_yaml_format):
+        """测试进度回调只在进度值变化时触发"""
+        parser = ProtocolParser(mock_yaml_format)
+
+        mock_yaml_format.config.head_len = 10
+
+        data_groups = [{"time": "2024-01-28 10:30:45.123", "data": "68 68"}] * 1000
+        progress_updates = []
+
+        parser.parse_data_groups(
+            data_groups, progress_callback=lambda c, t: progress_updates.append(c)
+        )
+
+        assert progress_updates == list(range(10, 80))
+
     def test_parse_data_groups_with_stop_callback(self, mock_yaml_format):
         """测试停止回调"""
         parser = ProtocolParser(mock_yaml_format)
@@ -17,6 +17,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from validate_configs import ConfigValidator, validate_all_configs
 
 
+def _joined(messages: list) -> str:
+    """将错误或警告列表拼接为一个字符串，便于批量做子串断言"""
+    return "\n".join(messages)
+
+
 class TestConfigValidatorInit:
     """测试ConfigValidator初始化"""
 
@@ -84,10 +89,11 @@ meta:
 
         assert result is False
         assert len(validator.errors) > 0
+        errs = _joined(validator.errors)
         # 验证错误消息包含YAML语法错误提示
-        assert any("YAML" in error or "syntax" in error.lower() or "indent" in error.lower()
-                  or "mapping" in error.lower() or "allowed" in error.lower()
-                  for error in validator.errors)
+        assert "YAML" in errs or any(
+            key in errs.lower() for key in ("syntax", "indent", "mapping", "allowed")
+        )
 
     def test_validate_protocol_config_missing_required_fields(self, tmp_path):
         """测试缺少必需字段的配置"""
@@ -106,9 +112,9 @@ compatibility:
 
         assert result is False
         assert len(validator.errors) > 0
+        errs = _joined(validator.errors)
         # 验证错误消息包含缺少必需字段的提示
-        assert any("required" in error.lower() or "missing" in error.lower() or "meta" in error.lower()
-                  for error in validator.errors)
+        assert any(key in errs.lower() for key in ("required", "missing", "meta"))
 
     def test_validate_protocol_config_clears_previous_results(self, tmp_path):
         """测试验证时清除之前的错误和警告"""
@@ -176,8 +182,9 @@ cmds:
         validator = ConfigValidator()
         result = validator.validate_protocol_config(config_file)
 
+        errs = _joined(validator.errors)
         # 验证端序错误
-        assert any("Invalid default_endian" in error for error in validator.errors)
+        assert "Invalid default_endian" in errs
         # 验证至少有一个错误
         assert len(validator.errors) > 0
         # 验证验证失败
@@ -275,8 +282,9 @@ cmds:
         validator = ConfigValidator()
         result = validator.validate_protocol_config(config_file)
 
+        warns = _joined(validator.warnings)
         # 验证命令ID范围警告
-        assert any("outside typical range" in warning for warning in validator.warnings)
+        assert "outside typical range" in warns
         # 验证有两个命令ID超出范围
         assert len(validator.warnings) >= 2
         # 验证验证仍成功(警告不阻塞)
@@ -346,10 +354,11 @@ cmds:
         validator = ConfigValidator()
         result = validator.validate_protocol_config(config_file)
 
+        errs = _joined(validator.errors)
         # 验证长度不匹配错误
-        assert any("doesn't match type" in error for error in validator.errors)
+        assert "doesn't match type" in errs
         # 验证错误消息包含字段名
-        assert any("test_field" in error for error in validator.errors)
+        assert "test_field" in errs
         # 验证至少有一个错误
         assert len(validator.errors) > 0
         # 验证验证失败
@@ -409,14 +418,15 @@ cmds:
         validator = ConfigValidator()
         result = validator.validate_protocol_config(config_file)
 
+        warns = _joined(validator.warnings)
         # 验证缩放因子警告
-        assert any("Scale factor on non-numeric field" in warning for warning in validator.warnings)
+        assert "Scale factor on non-numeric field" in warns
         # 验证警告消息包含字段名
-        assert any("test_field" in warning for warning in validator.warnings)
+        assert "test_field" in warns
         # 验证至少有一个警告
         assert len(validator.warnings) > 0
         # 验证有缩放因子的警告
-        assert any("scale" in warning.lower() for warning in validator.warnings)
+        assert "scale" in warns.lower()
 
     def test_scale_on_numeric_field_valid(self, tmp_path):
         """测试数值字段使用缩放因子"""
@@ -478,10 +488,11 @@ cmds:
         validator = ConfigValidator()
         result = validator.validate_protocol_config(config_file)
 
+        warns = _joined(validator.warnings)
         # 验证未使用类型警告
-        assert any("Unused type definitions" in warning for warning in validator.warnings)
+        assert "Unused type definitions" in warns
         # 验证未使用的类型名
-        assert any("uint16" in warning for warning in validator.warnings)
+        assert "uint16" in warns
         # 验证至少有一个警告
         assert len(validator.warnings) > 0
         # 验证验证成功(警告不阻塞)
@@ -513,8 +524,9 @@ cmds:
         validator = ConfigValidator()
         result = validator.validate_protocol_config(config_file)
 
+        warns = _joined(validator.warnings)
         # 验证没有未使用类型警告
-        assert not any("Unused type definitions" in warning for warning in validator.warnings)
+        assert "Unused type definitions" not in warns
         # 验证没有警告
         assert len(validator.warnings) == 0
         # 验证验证成功
@@ -551,10 +563,11 @@ cmds:
         validator = ConfigValidator()
         result = validator.validate_protocol_config(config_file)
 
+        warns = _joined(validator.warnings)
         # 验证未使用枚举警告
-        assert any("Unused enum definitions" in warning for warning in validator.warnings)
+        assert "Unused enum definitions" in warns
         # 验证未使用的枚举名
-        assert any("status" in warning for warning in validator.warnings)
+        assert "status" in warns
         # 验证至少有一个警告
         assert len(validator.warnings) > 0
         # 验证验证成功(警告不阻塞)
@@ -591,8 +604,9 @@ cmds:
         validator = ConfigValidator()
         result = validator.validate_protocol_config(config_file)
 
+        warns = _joined(validator.warnings)
         # 验证没有未使用枚举警告
-        assert not any("Unused enum definitions" in warning for warning in validator.warnings)
+        assert "Unused enum definitions" not in warns
         # 验证没有警告
         assert len(validator.warnings) == 0
         # 验证验证成功
@@ -630,10 +644,11 @@ cmds:
         validator = ConfigValidator()
         result = validator.validate_protocol_config(config_file)
 
+        errs = _joined(validator.errors)
         # 验证组内字段类型一致性错误
-        assert any("doesn't match type" in error for error in validator.errors)
+        assert "doesn't match type" in errs
         # 验证错误消息包含字段名
-        assert any("field1" in error for error in validator.errors)
+        assert "field1" in errs
         # 验证至少有一个错误
         assert len(validator.errors) > 0
         # 验证验证失败
@@ -669,8 +684,9 @@ cmds:
         validator = ConfigValidator()
         result = validator.validate_protocol_config(config_file)
 
+        warns = _joined(validator.warnings)
         # 验证所有类型都被使用（不应有未使用类型警告）
-        assert not any("Unused type definitions" in warning for warning in validator.warnings)
+        assert "Unused type definitions" not in warns
         # 验证没有警告
         assert len(validator.warnings) == 0
         # 验证验证成功
@@ -738,8 +754,9 @@ cmds:
         assert result is False
         # 验证有错误
         assert len(validator.errors) > 0
+        errs = _joined(validator.errors)
         # 验证错误消息包含类型未定义信息
-        assert any("uint8" in error or "type" in error.lower() for error in validator.errors)
+        assert "uint8" in errs or "type" in errs.lower()
 
     def test_nonexistent_file(self, tmp_path):
         """测试不存在的文件"""
@@ -750,9 +767,10 @@ cmds:
 
         assert result is False
         assert len(validator.errors) > 0
-        assert any("Failed to load config" in error for error in validator.errors)
+        errs = _joined(validator.errors)
+        assert "Failed to load config" in errs
         # 验证有加载错误
-        assert any("load" in error.lower() for error in validator.errors)
+        assert "load" in errs.lower()
 
     def test_file_with_special_characters(self, tmp_path):
         """测试包含特殊字符的配置"""
@@ -1282,18 +1300,28 @@ cmds:
         assert result is False
         assert len(validator.errors) > 0
 
-    def test_nonexistent_file_error_message(self, tmp_path):
+
+@pytest.fixture(scope="class")
+def validator() -> ConfigValidator:
+    """同一测试类共享的验证器，validate_protocol_config 每次调用前会自行清空结果"""
+    return ConfigValidator()
+
+
+class TestValidateProtocolConfigMessages:
+    """测试验证结果的消息内容"""
+
+    def test_nonexistent_file_error_message(self, validator, tmp_path):
         """测试不存在文件的错误消息内容"""
         nonexistent = tmp_path / "nonexistent.yaml"
 
-        validator = ConfigValidator()
         validator.validate_protocol_config(nonexistent)
 
         # 验证错误消息包含文件路径信息
         assert len(validator.errors) > 0
-        assert any("Failed to load config" in error for error in validator.errors)
+        errs = _joined(validator.errors)
+        assert "Failed to load config" in errs
 
-    def test_invalid_endian_error_message(self, tmp_path):
+    def test_invalid_endian_error_message(self, validator, tmp_path):
         """测试无效端序的错误消息"""
         config_content = """
 meta:
@@ -1316,13 +1344,13 @@ cmds:
         config_file = tmp_path / "protocol.yaml"
         config_file.write_text(config_content, encoding="utf-8")
 
-        validator = ConfigValidator()
-        result = validator.validate_protocol_config(config_file)
+        validator.validate_protocol_config(config_file)
 
+        errs = _joined(validator.errors)
         # 验证端序错误消息
-        assert any("Invalid default_endian" in error for error in validator.errors)
+        assert "Invalid default_endian" in errs
 
-    def test_command_id_out_of_range_warning_message(self, tmp_path):
+    def test_command_id_out_of_range_warning_message(self, validator, tmp_path):
         """测试命令ID超出范围的警告消息"""
         config_content = """
 meta:
@@ -1347,14 +1375,14 @@ cmds:
         config_file = tmp_path / "protocol.yaml"
         config_file.write_text(config_content, encoding="utf-8")
 
-        validator = ConfigValidator()
-        result = validator.validate_protocol_config(config_file)
+        validator.validate_protocol_config(config_file)
 
+        warns = _joined(validator.warnings)
         # 验证警告消息内容
-        assert any("Command ID 0 outside typical range" in warning for warning in validator.warnings)
-        assert any("Command ID 65536 outside typical range" in warning for warning in validator.warnings)
+        assert "Command ID 0 outside typical range" in warns
+        assert "Command ID 65536 outside typical range" in warns
 
-    def test_field_length_mismatch_error_message(self, tmp_path):
+    def test_field_length_mismatch_error_message(self, validator, tmp_path):
         """测试字段长度不匹配的错误消息"""
         config_content = """
 meta:
@@ -1377,14 +1405,14 @@ cmds:
         config_file = tmp_path / "protocol.yaml"
         config_file.write_text(config_content, encoding="utf-8")
 
-        validator = ConfigValidator()
-        result = validator.validate_protocol_config(config_file)
+        validator.validate_protocol_config(config_file)
 
+        errs = _joined(validator.errors)
         # 验证错误消息包含具体信息
-        assert any("doesn't match type" in error for error in validator.errors)
-        assert any("test_field" in error for error in validator.errors)
+        assert "doesn't match type" in errs
+        assert "test_field" in errs
 
-    def test_unused_type_warning_message(self, tmp_path):
+    def test_unused_type_warning_message(self, validator, tmp_path):
         """测试未使用类型的警告消息"""
         config_content = """
 meta:
@@ -1408,9 +1436,9 @@ cmds:
         config_file = tmp_path / "protocol.yaml"
         config_file.write_text(config_content, encoding="utf-8")
 
-        validator = ConfigValidator()
-        result = validator.validate_protocol_config(config_file)
+        validator.validate_protocol_config(config_file)
 
+        warns = _joined(validator.warnings)
         # 验证警告消息包含未使用的类型名
-        assert any("Unused type definitions" in warning for warning in validator.warnings)
-        assert any("unused_uint16" in warning for warning in validator.warnings)
+        assert "Unused type definitions" in warns
+        assert "unused_uint16" in warns
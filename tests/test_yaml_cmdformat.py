@@ -26,36 +26,24 @@ from src.yaml_config import EnumDef, Field, Group, Meta, ProtocolConfig, TypeDef
 class TestYamlCmdFormatInit:
     """测试 YamlCmdFormat 初始化"""
 
-    def test_init_with_valid_config(self, v8_config_path):
-        """测试使用有效配置初始化"""
-        cmd_format = YamlCmdFormat(v8_config_path)
+    @pytest.mark.parametrize("path_wrap", [str, Path])
+    def test_init_with_valid_config(self, v8_config_path, path_wrap):
+        """测试使用有效配置初始化（str 与 pathlib.Path 路径）"""
+        cmd_format = YamlCmdFormat(path_wrap(v8_config_path))
 
         assert cmd_format.config_path == Path(v8_config_path)
         assert cmd_format.config is not None
         assert cmd_format.config.meta.protocol == "v8"
         assert cmd_format.field_parser is not None
 
-    def test_init_with_pathlib_path(self, v8_config_path):
-        """测试使用 pathlib.Path 初始化"""
-        cmd_format = YamlCmdFormat(Path(v8_config_path))
-
-        assert cmd_format.config_path == Path(v8_config_path)
-        assert cmd_format.config is not None
-
     def test_init_with_invalid_path(self):
         """测试使用无效路径初始化"""
         with pytest.raises(FileNotFoundError):
             YamlCmdFormat("nonexistent_config.yaml")
 
     def test_init_cache_mechanism(self, v8_config_path):
-        """测试配置缓存机制"""
-        # 第一次加载
-        cmd_format1 = YamlCmdFormat(v8_config_path)
-        # 第二次加载应该使用缓存
-        cmd_format2 = YamlCmdFormat(v8_config_path)
-
-        # 验证两个实例的配置是同一个对象（缓存）
-        assert cmd_format1.config is cmd_format2.config
+        """测试配置缓存机制：两次加载得到同一个配置对象"""
+        assert YamlCmdFormat(v8_config_path).config is YamlCmdFormat(v8_config_path).config
 
 
 class TestGetCmdLayout:
@@ -70,10 +58,9 @@ class TestGetCmdLayout:
 
         assert isinstance(layout, list)
         assert len(layout) > 0
-        # 验证布局包含 Field 或 Group 对象（导入类型可能不同，使用字符串检查）
+        # 验证布局包含 Field 或 Group 对象
         for item in layout:
-            type_name = type(item).__name__
-            assert type_name in ["Field", "Group"]
+            assert isinstance(item, (Field, Group))
 
     def test_get_nonexistent_command_layout(self, v8_config_path):
         """测试获取不存在的命令布局"""
@@ -102,8 +89,7 @@ class TestGetCmdLayout:
         # 获取一个可能包含循环结构的命令
         layout = cmd_format.get_cmd_layout(2)
 
-        has_field = any(type(item).__name__ == "Field" for item in layout)
-        has_group = any(type(item).__name__ == "Group" for item in layout)
+        has_field = any(isinstance(item, Field) for item in layout)
 
         # 至少应该有字段
         assert has_field or len(layout) > 0
@@ -224,6 +210,16 @@ class TestGetSupportedCmds:
         # 转为集合检查唯一性
         assert len(cmds) == len(set(cmds))
 
+    def test_get_supported_commands_returns_copy(self, v8_config_path):
+        """测试修改返回的命令列表不影响后续调用"""
+        cmd_format = YamlCmdFormat(v8_config_path)
+
+        cmds = cmd_format.get_supported_cmds()
+        cmds.clear()
+        cmd_format.get_protocol_info()["supported_cmds"].append(-1)
+
+        assert cmd_format.get_supported_cmds() == list(cmd_format.config.cmds)
+
 
 class TestGetProtocolInfo:
     """测试获取协议信息"""
@@ -356,15 +352,10 @@ class TestValidateConfig:
 class TestLoadYamlFormat:
     """测试加载YAML格式配置函数"""
 
-    def test_load_yaml_format_returns_instance(self, v8_config_path):
-        """测试加载YAML格式返回实例"""
-        cmd_format = load_yaml_format(v8_config_path)
-
-        assert isinstance(cmd_format, YamlCmdFormat)
-
-    def test_load_yaml_format_with_pathlib(self, v8_config_path):
-        """测试使用pathlib.Path加载"""
-        cmd_format = load_yaml_format(Path(v8_config_path))
+    @pytest.mark.parametrize("path_wrap", [str, Path])
+    def test_load_yaml_format_returns_instance(self, v8_config_path, path_wrap):
+        """测试加载YAML格式返回实例（str 与 pathlib.Path 路径）"""
+        cmd_format = load_yaml_format(path_wrap(v8_config_path))
 
         assert isinstance(cmd_format, YamlCmdFormat)
 
@@ -2,25 +2,31 @@
 测试YAML配置加载和验证
 """
 
-import sys
-from pathlib import Path
+import pickle
+import re
 
 import pytest
 
-# 添加src目录到路径
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
+# src 目录由 conftest.py 加入 sys.path
+import yaml_config
 from yaml_config import ProtocolConfig, yaml_loader, TypeDef, BitfieldGroup, Group
+from yaml_config import DISK_CACHE_SUFFIX, YamlConfigLoader
+
+# 参数校验错误信息的匹配模式
+_RE_UINT_BYTES = re.compile(r"Type uint requires 'bytes' parameter")
+_RE_INT_BYTES = re.compile(r"Type int requires 'bytes' parameter")
+_RE_BITSET_BITS = re.compile(r"Bitset type requires 'bits' parameter")
+_RE_BITFIELD_BYTES = re.compile(r"Bitfield type requires 'bytes' parameter")
+_RE_GROUP_NO_REPEAT = re.compile(r"Group must specify either repeat_by or repeat_const")
+_RE_GROUP_BOTH_REPEAT = re.compile(r"Group cannot specify both repeat_by and repeat_const")
 
 
 class TestYamlConfig:
     """YAML配置测试类"""
 
-    def test_load_v8_config(self):
+    def test_load_v8_config(self, configs):
         """测试加载v8配置"""
-        config_path = Path("configs/v8/protocol.yaml")
-        config = yaml_loader.load_protocol_config(config_path)
-
+        config = configs["v8"]
         assert config.meta.protocol == "v8"
         assert config.meta.version == 1
         assert config.meta.default_endian == "LE"
@@ -30,32 +36,27 @@ class TestYamlConfig:
         assert config.tail_len == 2
         assert config.frame_head == "AA F5"
 
-    def test_load_xiaoju_config(self):
+    def test_load_xiaoju_config(self, configs):
         """测试加载xiaoju配置"""
-        config_path = Path("configs/xiaoju/protocol.yaml")
-        config = yaml_loader.load_protocol_config(config_path)
-
+        config = configs["xiaoju"]
         assert config.meta.protocol == "xiaoju"
         assert config.meta.version == 1
         assert config.head_len == 14
         assert config.tail_len == 1
         assert config.frame_head == "7D D0"
 
-    def test_validate_all_configs(self):
+    @pytest.mark.parametrize("protocol", ["v8", "xiaoju", "yunwei", "sinexcel"])
+    def test_validate_all_configs(self, validation_results, protocol):
         """测试验证所有配置"""
-        protocols = ["v8", "xiaoju", "yunwei", "sinexcel"]
+        if protocol not in validation_results:
+            pytest.skip(f"配置文件不存在: {protocol}")
 
-        for protocol in protocols:
-            config_path = Path(f"configs/{protocol}/protocol.yaml")
-            if config_path.exists():
-                config = yaml_loader.load_protocol_config(config_path)
-                errors = yaml_loader.validate_config(config)
-                assert len(errors) == 0, f"Protocol {protocol} has validation errors: {errors}"
+        errors = validation_results[protocol]
+        assert errors == [], f"Protocol {protocol} has validation errors: {errors}"
 
-    def test_get_cmd_layout(self):
+    def test_get_cmd_layout(self, configs):
         """测试获取命令布局"""
-        config_path = Path("configs/v8/protocol.yaml")
-        config = yaml_loader.load_protocol_config(config_path)
+        config = configs["v8"]
 
         # 测试存在的命令
         layout = yaml_loader.get_cmd_layout(config, 2)
@@ -65,16 +66,12 @@ class TestYamlConfig:
         with pytest.raises(ValueError):
             yaml_loader.get_cmd_layout(config, 9999)
 
-    def test_type_definitions(self):
+    def test_type_definitions(self, configs):
         """测试类型定义"""
-        config_path = Path("configs/v8/protocol.yaml")
-        config = yaml_loader.load_protocol_config(config_path)
+        config = configs["v8"]
 
         # 检查基本类型
-        assert "uint8" in config.types
-        assert "uint16" in config.types
-        assert "uint32" in config.types
-        assert "ascii" in config.types
+        assert {"uint8", "uint16", "uint32", "ascii"} <= config.types.keys()
 
         # 检查类型属性
         uint8_type = config.types["uint8"]
@@ -82,10 +79,9 @@ class TestYamlConfig:
         assert uint8_type.bytes == 1
         assert uint8_type.signed == False
 
-    def test_enum_definitions(self):
+    def test_enum_definitions(self, configs):
         """测试枚举定义"""
-        config_path = Path("configs/v8/protocol.yaml")
-        config = yaml_loader.load_protocol_config(config_path)
+        config = configs["v8"]
 
         # 检查枚举存在
         assert "login_result" in config.enums
@@ -97,44 +93,161 @@ class TestYamlConfig:
         assert login_result.values[0] == "失败"
         assert login_result.values[1] == "成功"
 
+    def test_field_names_interned(self):
+        """测试不同命令中的同名字段名、字段ID共享同一字符串对象"""
+        config = yaml_loader._parse_config(
+            {
+                "meta": {"protocol": "t", "version": 1, "default_endian": "LE"},
+                "types": {"uint8": {"base": "uint", "bytes": 1}},
+                "cmds": {
+                    1: [{"len": 1, "name": "count", "type": "uint8", "id": "cnt"}],
+                    2: [
+                        {
+                            "len": 1,
+                            "name": "".join(["co", "unt"]),
+                            "type": "uint8",
+                            "id": "".join(["cn", "t"]),
+                        },
+                        {"repeat_by": "".join(["c", "nt"]), "fields": []},
+                    ],
+                },
+            }
+        )
+
+        first, second = config.cmds[1][0], config.cmds[2][0]
+        assert first.name is second.name
+        assert first.id is second.id
+        assert config.cmds[2][1].repeat_by is first.id
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
 
 class TestTypeDefValidation:
     """测试 TypeDef 参数验证"""
 
-    def test_uint_missing_bytes(self):
-        """验证 uint 类型缺少 bytes 参数"""
-        with pytest.raises(ValueError, match=r"Type uint requires 'bytes' parameter"):
-            TypeDef(base="uint", bytes=None)
-
-    def test_int_missing_bytes(self):
-        """验证 int 类型缺少 bytes 参数"""
-        with pytest.raises(ValueError, match=r"Type int requires 'bytes' parameter"):
-            TypeDef(base="int", bytes=None)
-
-    def test_bitset_missing_bits(self):
-        """验证 bitset 类型缺少 bits 参数"""
-        with pytest.raises(ValueError, match=r"Bitset type requires 'bits' parameter"):
-            TypeDef(base="bitset", bits=None)
-
-    def test_bitfield_missing_bytes(self):
-        """验证 bitfield 类型缺少 bytes 参数"""
-        with pytest.raises(ValueError, match=r"Bitfield type requires 'bytes' parameter"):
-            TypeDef(base="bitfield", bytes=None)
+    @pytest.mark.parametrize(
+        "kwargs,pattern",
+        [
+            ({"base": "uint", "bytes": None}, _RE_UINT_BYTES),
+            ({"base": "int", "bytes": None}, _RE_INT_BYTES),
+            ({"base": "bitset", "bits": None}, _RE_BITSET_BITS),
+            ({"base": "bitfield", "bytes": None}, _RE_BITFIELD_BYTES),
+        ],
+        ids=[
+            "uint_missing_bytes",
+            "int_missing_bytes",
+            "bitset_missing_bits",
+            "bitfield_missing_bytes",
+        ],
+    )
+    def test_missing_required_param(self, kwargs, pattern):
+        """验证缺少必需参数时抛出 ValueError"""
+        with pytest.raises(ValueError, match=pattern):
+            TypeDef(**kwargs)
 
 
 class TestGroupValidation:
     """测试 Group 验证逻辑"""
 
-    def test_no_repeat_params(self):
-        """验证无循环条件"""
-        with pytest.raises(ValueError, match=r"Group must specify either repeat_by or repeat_const"):
-            Group(fields=[], repeat_by=None, repeat_const=None)
+    @pytest.mark.parametrize(
+        "repeat_by,repeat_const,pattern",
+        [
+            (None, None, _RE_GROUP_NO_REPEAT),
+            ("count", 10, _RE_GROUP_BOTH_REPEAT),
+        ],
+        ids=["no_repeat_params", "both_repeat_params"],
+    )
+    def test_invalid_repeat_params(self, repeat_by, repeat_const, pattern):
+        """验证循环条件缺失或重复设置时抛出 ValueError"""
+        with pytest.raises(ValueError, match=pattern):
+            Group(fields=[], repeat_by=repeat_by, repeat_const=repeat_const)
+
+
+class TestDiskCache:
+    """测试配置磁盘缓存"""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        """磁盘缓存目录（与YAML所在目录分开）"""
+        return tmp_path / "cache"
+
+    def test_cache_file_created_and_reused(self, temp_config_file, cache_dir):
+        """首次加载写入缓存，新加载器直接命中缓存"""
+        config = YamlConfigLoader(cache_dir).load_protocol_config(temp_config_file)
+        assert len(list(cache_dir.glob(f"*{DISK_CACHE_SUFFIX}"))) == 1
+
+        cached = YamlConfigLoader(cache_dir).load_protocol_config(temp_config_file)
+        assert cached == config
+
+    def test_cache_stores_built_config(self, temp_config_file, cache_dir):
+        """缓存保存构建完成的配置对象，而非YAML原始数据"""
+        YamlConfigLoader(cache_dir).load_protocol_config(temp_config_file)
+        (cache_path,) = cache_dir.iterdir()
+        assert isinstance(pickle.loads(cache_path.read_bytes()), ProtocolConfig)
+
+    def test_cache_invalidated_when_yaml_changes(self, temp_config_file, cache_dir):
+        """YAML修改后缓存失效并重新解析"""
+        YamlConfigLoader(cache_dir).load_protocol_config(temp_config_file)
+        content = temp_config_file.read_text(encoding="utf-8")
+        temp_config_file.write_text(
+            content.replace("test_protocol", "changed_protocol"), encoding="utf-8"
+        )
+
+        config = YamlConfigLoader(cache_dir).load_protocol_config(temp_config_file)
+        assert config.meta.protocol == "changed_protocol"
+
+    def test_cache_invalidated_when_code_changes(self, temp_config_file, cache_dir, monkeypatch):
+        """加载器源码变化后不复用旧缓存"""
+        YamlConfigLoader(cache_dir).load_protocol_config(temp_config_file)
+        monkeypatch.setattr(yaml_config, "_code_digest", lambda: b"changed")
+        YamlConfigLoader(cache_dir).load_protocol_config(temp_config_file)
+
+        assert len(list(cache_dir.iterdir())) == 2
+
+    def test_corrupted_cache_falls_back_to_yaml(self, temp_config_file, cache_dir):
+        """缓存损坏时回退到YAML解析"""
+        YamlConfigLoader(cache_dir).load_protocol_config(temp_config_file)
+        (cache_path,) = cache_dir.iterdir()
+        cache_path.write_bytes(b"not a pickle")
+
+        config = YamlConfigLoader(cache_dir).load_protocol_config(temp_config_file)
+        assert config.meta.protocol == "test_protocol"
+
+    def test_enable_disk_cache(self, temp_config_file, cache_dir):
+        """已创建的加载器启用磁盘缓存后写入缓存文件"""
+        loader = YamlConfigLoader()
+        loader.enable_disk_cache(cache_dir)
+        loader.load_protocol_config(temp_config_file)
+
+        assert len(list(cache_dir.iterdir())) == 1
+
+    def test_disk_cache_off_by_default(self, temp_config_file):
+        """默认不启用磁盘缓存，配置目录中不产生额外文件"""
+        YamlConfigLoader().load_protocol_config(temp_config_file)
+        assert list(temp_config_file.parent.iterdir()) == [temp_config_file]
+
+
+class TestMemoryCache:
+    """测试配置内存缓存"""
+
+    def test_same_file_returns_same_object(self, temp_config_file):
+        """文件未修改时返回同一个配置对象"""
+        loader = YamlConfigLoader()
+        assert loader.load_protocol_config(temp_config_file) is loader.load_protocol_config(
+            str(temp_config_file)
+        )
+
+    def test_reload_after_yaml_changes(self, temp_config_file):
+        """文件修改后同一加载器重新解析"""
+        loader = YamlConfigLoader()
+        first = loader.load_protocol_config(temp_config_file)
+        content = temp_config_file.read_text(encoding="utf-8")
+        temp_config_file.write_text(
+            content.replace("test_protocol", "changed_protocol"), encoding="utf-8"
+        )
+
+        second = loader.load_protocol_config(temp_config_file)
+        assert second is not first
+        assert second.meta.protocol == "changed_protocol"
 
-    def test_both_repeat_params(self):
-        """验证同时设置两个循环条件"""
-        with pytest.raises(ValueError, match=r"Group cannot specify both repeat_by and repeat_const"):
-            Group(fields=[], repeat_by="count", repeat_const=10)
 
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -11,8 +11,9 @@
 """
 
 import struct
+import time
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
 
 import pytest
 
@@ -28,46 +29,55 @@ from src.yaml_field_parser import (
     MISSING_FIELD_PLACEHOLDER,
     FieldDataMissing,
     YamlFieldParser,
+    _decimal_places,
+    _is_ascii_compatible,
+    _local_minute_prefix,
+    _scale_quantize_params,
+    _scale_value,
 )
 # ByteDataBuilder 在 fixtures 中定义，无需在此导入
 
 
+@pytest.fixture(scope="class")
+def class_parser(request):
+    """按测试类构建一次协议配置和解析器
+
+    测试类通过 CONFIG_DATA 提供配置字典，测试中以 self.config / self.parser 访问；
+    需要修改配置的测试应自行构建独立的配置。
+    """
+    request.cls.config = yaml_loader._parse_config(request.cls.CONFIG_DATA)
+    request.cls.parser = YamlFieldParser(request.cls.config)
+
+
+@pytest.mark.usefixtures("class_parser")
 class TestBasicTypes:
     """测试基础数据类型解析"""
 
-    def setup_method(self):
-        """设置测试环境"""
-        self.config = self._create_test_config()
-        self.parser = YamlFieldParser(self.config)
-
-    def _create_test_config(self) -> ProtocolConfig:
-        """创建测试用的协议配置"""
-        config_data = {
-            "meta": {"protocol": "test", "version": 1, "default_endian": "LE"},
-            "types": {
-                "uint8": {"base": "uint", "bytes": 1},
-                "uint16": {"base": "uint", "bytes": 2},
-                "uint32": {"base": "uint", "bytes": 4},
-                "uint64": {"base": "uint", "bytes": 8},
-                "int8": {"base": "int", "bytes": 1},
-                "int16": {"base": "int", "bytes": 2},
-                "int32": {"base": "int", "bytes": 4},
-                "int64": {"base": "int", "bytes": 8},
-                "ascii_str": {"base": "str", "encoding": "ASCII"},
-                "utf8_str": {"base": "str", "encoding": "UTF-8"},
-                "hex_type": {"base": "hex"},
-                "bcd_type": {"base": "bcd"},
-            },
-            "enums": {},
-            "cmds": {},
-            "compatibility": {
-                "head_len": 11,
-                "tail_len": 2,
-                "frame_head": "AA F5",
-                "head_fields": [],
-            },
-        }
-        return yaml_loader._parse_config(config_data)
+    CONFIG_DATA = {
+        "meta": {"protocol": "test", "version": 1, "default_endian": "LE"},
+        "types": {
+            "uint8": {"base": "uint", "bytes": 1},
+            "uint16": {"base": "uint", "bytes": 2},
+            "uint32": {"base": "uint", "bytes": 4},
+            "uint64": {"base": "uint", "bytes": 8},
+            "int8": {"base": "int", "bytes": 1},
+            "int16": {"base": "int", "bytes": 2},
+            "int32": {"base": "int", "bytes": 4},
+            "int64": {"base": "int", "bytes": 8},
+            "ascii_str": {"base": "str", "encoding": "ASCII"},
+            "utf8_str": {"base": "str", "encoding": "UTF-8"},
+            "hex_type": {"base": "hex"},
+            "bcd_type": {"base": "bcd"},
+        },
+        "enums": {},
+        "cmds": {},
+        "compatibility": {
+            "head_len": 11,
+            "tail_len": 2,
+            "frame_head": "AA F5",
+            "head_fields": [],
+        },
+    }
 
     def test_parse_uint8(self):
         """测试解析uint8"""
@@ -114,6 +124,27 @@ class TestBasicTypes:
         result = self.parser._parse_uint(data, type_def, field)
         assert result == 0x123456789ABCDEF0
 
+    def test_parse_uint_at_offset(self):
+        """测试按偏移直接从原始缓冲区解析整数"""
+        data = b"\xAA\xBB\x34\x12\xCC"
+        type_def = self.config.types["uint16"]
+        field = Field(len=2, name="test", type="uint16", endian="LE")
+
+        result = self.parser._parse_uint(data, type_def, field, 2)
+        assert result == 0x1234
+
+    def test_parse_single_byte_fields(self):
+        """测试单字节整数字段经 parse_fields 解析（直接按下标取值）"""
+        fields = [
+            Field(len=1, name="u", type="uint8"),
+            Field(len=1, name="neg", type="int8"),
+            Field(len=1, name="pos", type="int8"),
+        ]
+
+        result = self.parser.parse_fields(b"\xFF\x80\x7F", fields)
+
+        assert result == {"u": 255, "neg": -128, "pos": 127}
+
     def test_parse_int8_positive(self):
         """测试解析int8正数"""
         data = b"\x7F"  # 127
@@ -176,8 +207,8 @@ class TestBasicTypes:
         field = Field(len=3, name="test", type="ascii_str")
 
         result = self.parser._parse_str(data, type_def, field)
-        # hexlify 返回小写
-        assert result == "fffefd" or result == "FFFEFD"  # hex编码
+        # 与其他解析失败场景一致，回退为大写hex
+        assert result == "FFFEFD"
 
     def test_parse_empty_string(self):
         """测试解析空字符串"""
@@ -253,6 +284,23 @@ class TestBasicTypes:
         # 所有 null 字符被去除后应该是空字符串
         assert result == ""
 
+    def test_parse_string_gbk(self):
+        """测试解析GBK字符串（经缓存的编解码器解码）"""
+        data = "充电桩".encode("gbk") + b"\x00\x00"
+        type_def = TypeDef(base="str", encoding="GBK")
+        field = Field(len=len(data), name="test", type="gbk_str")
+
+        result = self.parser._parse_str(data, type_def, field)
+        assert result == "充电桩"
+
+    @pytest.mark.parametrize(
+        "encoding,expected",
+        [("ASCII", True), ("UTF-8", True), ("GBK", True), ("UTF-16", False), ("no-such", False)],
+    )
+    def test_ascii_fast_path_encodings(self, encoding, expected):
+        """测试纯ASCII快速路径只用于兼容ASCII的编码"""
+        assert _is_ascii_compatible(encoding) is expected
+
     def test_parse_hex(self):
         """测试解析十六进制"""
         data = b"\xAB\xCD\xEF"
@@ -311,205 +359,63 @@ class TestBasicTypes:
 
     # ========== 极值测试用例 ==========
 
-    def test_parse_uint8_max_value(self):
-        """测试 uint8 最大值 0xFF (255)"""
-        # Arrange
-        max_value = 0xFF  # 255
-        data = bytes([max_value])
-        type_def = self.config.types["uint8"]
-        field = Field(len=1, name="最大值", type="uint8")
-
-        # Act
-        result = self.parser._parse_uint(data, type_def, field)
-
-        # Assert
-        assert result == max_value
-
-    def test_parse_uint16_max_value(self):
-        """测试 uint16 最大值 0xFFFF (65535)"""
-        # Arrange
-        max_value = 0xFFFF  # 65535
-        data = max_value.to_bytes(2, byteorder='little')
-        type_def = self.config.types["uint16"]
-        field = Field(len=2, name="最大值", type="uint16", endian="LE")
-
-        # Act
-        result = self.parser._parse_uint(data, type_def, field)
-
-        # Assert
-        assert result == max_value
-
-    def test_parse_uint32_max_value(self):
-        """测试 uint32 最大值 0xFFFFFFFF (4294967295)"""
-        # Arrange
-        max_value = 0xFFFFFFFF  # 4294967295
-        data = max_value.to_bytes(4, byteorder='little')
-        type_def = self.config.types["uint32"]
-        field = Field(len=4, name="最大值", type="uint32", endian="LE")
-
-        # Act
-        result = self.parser._parse_uint(data, type_def, field)
-
-        # Assert
-        assert result == max_value
-
-    def test_parse_uint64_max_value(self):
-        """测试 uint64 最大值 0xFFFFFFFFFFFFFFFF (18446744073709551615)"""
-        # Arrange
-        max_value = 0xFFFFFFFFFFFFFFFF  # 18446744073709551615
-        data = max_value.to_bytes(8, byteorder='little')
-        type_def = self.config.types["uint64"]
-        field = Field(len=8, name="最大值", type="uint64", endian="LE")
-
-        # Act
-        result = self.parser._parse_uint(data, type_def, field)
-
-        # Assert
-        assert result == max_value
-
-    def test_parse_int8_min_value(self):
-        """测试 int8 最小值 -128"""
-        # Arrange
-        min_value = -128
-        data = bytes([0x80])  # -128 的补码表示
-        type_def = self.config.types["int8"]
-        field = Field(len=1, name="最小值", type="int8")
-
-        # Act
-        result = self.parser._parse_int(data, type_def, field)
-
-        # Assert
-        assert result == min_value
-
-    def test_parse_int8_max_value(self):
-        """测试 int8 最大值 127"""
-        # Arrange
-        max_value = 127
-        data = bytes([0x7F])  # 127 的补码表示
-        type_def = self.config.types["int8"]
-        field = Field(len=1, name="最大值", type="int8")
-
-        # Act
-        result = self.parser._parse_int(data, type_def, field)
-
-        # Assert
-        assert result == max_value
-
-    def test_parse_int16_min_value(self):
-        """测试 int16 最小值 -32768"""
-        # Arrange
-        min_value = -32768
-        data = min_value.to_bytes(2, byteorder='little', signed=True)
-        type_def = self.config.types["int16"]
-        field = Field(len=2, name="最小值", type="int16", endian="LE")
-
-        # Act
-        result = self.parser._parse_int(data, type_def, field)
-
-        # Assert
-        assert result == min_value
-
-    def test_parse_int16_max_value(self):
-        """测试 int16 最大值 32767"""
-        # Arrange
-        max_value = 32767
-        data = max_value.to_bytes(2, byteorder='little', signed=True)
-        type_def = self.config.types["int16"]
-        field = Field(len=2, name="最大值", type="int16", endian="LE")
-
-        # Act
-        result = self.parser._parse_int(data, type_def, field)
-
-        # Assert
-        assert result == max_value
-
-    def test_parse_int32_min_value(self):
-        """测试 int32 最小值 -2147483648"""
+    @pytest.mark.parametrize("endian", ["LE", "BE"])
+    @pytest.mark.parametrize(
+        "type_name,width,signed,value",
+        [
+            ("uint8", 1, False, 0xFF),
+            ("uint16", 2, False, 0xFFFF),
+            ("uint32", 4, False, 0xFFFFFFFF),
+            ("uint64", 8, False, 0xFFFFFFFFFFFFFFFF),
+            ("int8", 1, True, -128),
+            ("int8", 1, True, 127),
+            ("int16", 2, True, -32768),
+            ("int16", 2, True, 32767),
+            ("int32", 4, True, -2147483648),
+            ("int32", 4, True, 2147483647),
+            ("int64", 8, True, -9223372036854775808),
+            ("int64", 8, True, 9223372036854775807),
+        ],
+    )
+    def test_parse_integer_extreme_values(self, type_name, width, signed, value, endian):
+        """测试整数类型的最小/最大值（大小端）"""
         # Arrange
-        min_value = -2147483648
-        data = min_value.to_bytes(4, byteorder='little', signed=True)
-        type_def = self.config.types["int32"]
-        field = Field(len=4, name="最小值", type="int32", endian="LE")
+        byteorder = "little" if endian == "LE" else "big"
+        data = value.to_bytes(width, byteorder=byteorder, signed=signed)
+        type_def = self.config.types[type_name]
+        field = Field(len=width, name="极值", type=type_name, endian=endian)
+        parse = self.parser._parse_int if signed else self.parser._parse_uint
 
         # Act
-        result = self.parser._parse_int(data, type_def, field)
+        result = parse(data, type_def, field)
 
         # Assert
-        assert result == min_value
-
-    def test_parse_int32_max_value(self):
-        """测试 int32 最大值 2147483647"""
-        # Arrange
-        max_value = 2147483647
-        data = max_value.to_bytes(4, byteorder='little', signed=True)
-        type_def = self.config.types["int32"]
-        field = Field(len=4, name="最大值", type="int32", endian="LE")
-
-        # Act
-        result = self.parser._parse_int(data, type_def, field)
-
-        # Assert
-        assert result == max_value
-
-    def test_parse_int64_min_value(self):
-        """测试 int64 最小值 -9223372036854775808"""
-        # Arrange
-        min_value = -9223372036854775808
-        data = min_value.to_bytes(8, byteorder='little', signed=True)
-        type_def = self.config.types["int64"]
-        field = Field(len=8, name="最小值", type="int64", endian="LE")
-
-        # Act
-        result = self.parser._parse_int(data, type_def, field)
-
-        # Assert
-        assert result == min_value
-
-    def test_parse_int64_max_value(self):
-        """测试 int64 最大值 9223372036854775807"""
-        # Arrange
-        max_value = 9223372036854775807
-        data = max_value.to_bytes(8, byteorder='little', signed=True)
-        type_def = self.config.types["int64"]
-        field = Field(len=8, name="最大值", type="int64", endian="LE")
-
-        # Act
-        result = self.parser._parse_int(data, type_def, field)
-
-        # Assert
-        assert result == max_value
+        assert result == value
 
 
+@pytest.mark.usefixtures("class_parser")
 class TestTimeFormats:
     """测试时间格式解析"""
 
-    def setup_method(self):
-        """设置测试环境"""
-        self.config = self._create_test_config()
-        self.parser = YamlFieldParser(self.config)
-
-    def _create_test_config(self) -> ProtocolConfig:
-        """创建测试用的协议配置"""
-        config_data = {
-            "meta": {"protocol": "test", "version": 1, "default_endian": "LE"},
-            "types": {
-                "cp56time2a": {"base": "time.cp56time2a"},
-                "bcd_time7": {"base": "time.bcd7"},
-                "bcd_time8": {"base": "time.bcd8"},
-                "bin_time7": {"base": "time.bin7"},
-                "unix_time": {"base": "time.unix"},
-                "unix_time_ms": {"base": "time.unix_ms"},
-            },
-            "enums": {},
-            "cmds": {},
-            "compatibility": {
-                "head_len": 11,
-                "tail_len": 2,
-                "frame_head": "AA F5",
-                "head_fields": [],
-            },
-        }
-        return yaml_loader._parse_config(config_data)
+    CONFIG_DATA = {
+        "meta": {"protocol": "test", "version": 1, "default_endian": "LE"},
+        "types": {
+            "cp56time2a": {"base": "time.cp56time2a"},
+            "bcd_time7": {"base": "time.bcd7"},
+            "bcd_time8": {"base": "time.bcd8"},
+            "bin_time7": {"base": "time.bin7"},
+            "unix_time": {"base": "time.unix"},
+            "unix_time_ms": {"base": "time.unix_ms"},
+        },
+        "enums": {},
+        "cmds": {},
+        "compatibility": {
+            "head_len": 11,
+            "tail_len": 2,
+            "frame_head": "AA F5",
+            "head_fields": [],
+        },
+    }
 
     def test_parse_cp56time2a(self):
         """测试解析CP56Time2a时间格式"""
@@ -555,6 +461,15 @@ class TestTimeFormats:
         result = self.parser._parse_bcd_time7(data, type_def, field)
         assert result == "2024-01-15 12:30:45"
 
+    def test_parse_bcd_time7_invalid_nibble(self):
+        """测试BCD时间包含无效半字节（回退到hex）"""
+        data = bytes([0x20, 0x24, 0x1A, 0x15, 0x12, 0x30, 0x45])
+        type_def = self.config.types["bcd_time7"]
+        field = Field(len=7, name="test", type="bcd_time7")
+
+        result = self.parser._parse_bcd_time7(data, type_def, field)
+        assert result == "20241A15123045"
+
     def test_parse_bcd_time7_insufficient_bytes(self):
         """测试BCD时间字节不足"""
         data = b"\x20\x24\x01"  # 只有3字节
@@ -670,70 +585,88 @@ class TestTimeFormats:
         with pytest.raises(ValueError, match="需要8字节"):
             self.parser._parse_unix_time_ms(data, type_def, field)
 
+    @pytest.mark.skipif(not hasattr(time, "tzset"), reason="需要 time.tzset 切换时区")
+    def test_parse_unix_time_offset_with_seconds(self, monkeypatch):
+        """测试偏移带秒数的时区（1972年前的 Africa/Monrovia 为 -00:44:30）"""
+        monkeypatch.setenv("TZ", "Africa/Monrovia")
+        time.tzset()
+        _local_minute_prefix.cache_clear()
+        try:
+            for timestamp in (100, 100 * 60 + 59):
+                data = struct.pack("<L", timestamp)
+                result = self.parser._parse_unix_time(
+                    data, self.config.types["unix_time"], Field(len=4, name="t", type="unix_time")
+                )
+                expected = datetime.fromtimestamp(timestamp)
+                assert result == expected.strftime("%Y-%m-%d %H:%M:%S")
+
+            data = struct.pack("<Q", 100123)
+            result = self.parser._parse_unix_time_ms(
+                data, self.config.types["unix_time_ms"], Field(len=8, name="t", type="unix_time_ms")
+            )
+            assert result == datetime.fromtimestamp(100).strftime("%Y-%m-%d %H:%M:%S") + ".123"
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+            _local_minute_prefix.cache_clear()
 
+
+@pytest.mark.usefixtures("class_parser")
 class TestBitsetAndBitfield:
     """测试位段解析"""
 
-    def setup_method(self):
-        """设置测试环境"""
-        self.config = self._create_test_config()
-        self.parser = YamlFieldParser(self.config)
-
-    def _create_test_config(self) -> ProtocolConfig:
-        """创建测试用的协议配置"""
-        config_data = {
-            "meta": {"protocol": "test", "version": 1, "default_endian": "LE"},
-            "types": {
-                "uint8": {"base": "uint", "bytes": 1},
-                "uint16": {"base": "uint", "bytes": 2},
-                "bitset8": {
-                    "base": "bitset",
-                    "bits": [
-                        {"name": "bit0"},
-                        {"name": "bit1"},
-                        {"name": "bit2"},
-                        {"name": "bit3"},
-                    ],
-                },
-                "bitfield8": {
-                    "base": "bitfield",
-                    "bytes": 1,
-                    "order": "lsb0",
-                    "groups": [
-                        {"name": "field1", "start_bit": 0, "width": 2, "enum": "status"},
-                        {"name": "field2", "start_bit": 2, "width": 3},
-                        {"name": "field3", "start_bit": 5, "width": 3},
-                    ],
-                },
-                "bitfield16": {
-                    "base": "bitfield",
-                    "bytes": 2,
-                    "order": "lsb0",
-                    "groups": [
-                        {"name": "low", "start_bit": 0, "width": 8},
-                        {"name": "high", "start_bit": 8, "width": 8},
-                    ],
-                },
-                "bitfield_msb0": {
-                    "base": "bitfield",
-                    "bytes": 2,
-                    "order": "msb0",
-                    "groups": [
-                        {"name": "msb_field", "start_bit": 0, "width": 8},
-                        {"name": "lsb_field", "start_bit": 8, "width": 8},
-                    ],
-                },
+    CONFIG_DATA = {
+        "meta": {"protocol": "test", "version": 1, "default_endian": "LE"},
+        "types": {
+            "uint8": {"base": "uint", "bytes": 1},
+            "uint16": {"base": "uint", "bytes": 2},
+            "bitset8": {
+                "base": "bitset",
+                "bits": [
+                    {"name": "bit0"},
+                    {"name": "bit1"},
+                    {"name": "bit2"},
+                    {"name": "bit3"},
+                ],
             },
-            "enums": {"status": {0: "关闭", 1: "开启", 2: "故障", 3: "维护"}},
-            "cmds": {},
-            "compatibility": {
-                "head_len": 11,
-                "tail_len": 2,
-                "frame_head": "AA F5",
-                "head_fields": [],
+            "bitfield8": {
+                "base": "bitfield",
+                "bytes": 1,
+                "order": "lsb0",
+                "groups": [
+                    {"name": "field1", "start_bit": 0, "width": 2, "enum": "status"},
+                    {"name": "field2", "start_bit": 2, "width": 3},
+                    {"name": "field3", "start_bit": 5, "width": 3},
+                ],
             },
-        }
-        return yaml_loader._parse_config(config_data)
+            "bitfield16": {
+                "base": "bitfield",
+                "bytes": 2,
+                "order": "lsb0",
+                "groups": [
+                    {"name": "low", "start_bit": 0, "width": 8},
+                    {"name": "high", "start_bit": 8, "width": 8},
+                ],
+            },
+            "bitfield_msb0": {
+                "base": "bitfield",
+                "bytes": 2,
+                "order": "msb0",
+                "groups": [
+                    {"name": "msb_field", "start_bit": 0, "width": 8},
+                    {"name": "lsb_field", "start_bit": 8, "width": 8},
+                ],
+            },
+        },
+        "enums": {"status": {0: "关闭", 1: "开启", 2: "故障", 3: "维护"}},
+        "cmds": {},
+        "compatibility": {
+            "head_len": 11,
+            "tail_len": 2,
+            "frame_head": "AA F5",
+            "head_fields": [],
+        },
+    }
 
     def test_parse_bitset(self):
         """测试解析bitset"""
@@ -773,6 +706,13 @@ class TestBitsetAndBitfield:
         assert "raw" in result
         assert result["raw"] == "ABCD"
 
+    def test_parse_bitset_empty_data(self):
+        """测试空数据的bitset返回空的原始值，而不是展开出位"""
+        type_def = self.config.types["bitset8"]
+        field = Field(len=0, name="test", type="bitset8")
+
+        assert self.parser._parse_bitset(b"", type_def, field) == {"raw": ""}
+
     def test_parse_bitset_2bytes(self):
         """测试解析2字节bitset"""
         # 0x1234 (小端序) = 0b0001001000110100
@@ -788,6 +728,15 @@ class TestBitsetAndBitfield:
         assert result["bit2"] is True
         assert result["bit3"] is False
 
+    def test_parse_bitset_4bytes_be(self):
+        """测试解析4字节大端bitset"""
+        data = b"\x00\x00\x00\x05"
+        type_def = self.config.types["bitset8"]
+        field = Field(len=4, name="test", type="bitset8", endian="BE")
+
+        result = self.parser._parse_bitset(data, type_def, field)
+        assert result == {"bit0": True, "bit1": False, "bit2": True, "bit3": False}
+
     def test_parse_bitfield_with_enum(self):
         """测试解析带枚举的bitfield"""
         # 0b10101010
@@ -826,6 +775,16 @@ class TestBitsetAndBitfield:
         assert result["msb_field"] == 0x12
         assert result["lsb_field"] == 0x34
 
+    def test_bitfield_plan_cached(self):
+        """测试位段提取计划只构建一次"""
+        type_def = self.config.types["bitfield8"]
+        field = Field(len=1, name="test", type="bitfield8")
+
+        plan1 = self.parser._get_bitfield_plan(type_def, field, 8)
+        plan2 = self.parser._get_bitfield_plan(type_def, field, 8)
+        assert plan1 is plan2
+        assert plan1[0] == ("field1", 0, 0b11, self.config.enums["status"].values)
+
     def test_parse_bitfield_no_groups(self):
         """测试没有定义组的bitfield（回退到hex）"""
         data = b"\xAB\xCD"
@@ -837,115 +796,132 @@ class TestBitsetAndBitfield:
         assert result["raw"] == "ABCD"
 
 
+@pytest.mark.usefixtures("class_parser")
 class TestPostProcessing:
     """测试后处理功能（scale/unit/enum）"""
 
-    def setup_method(self):
-        """设置测试环境"""
-        self.config = self._create_test_config()
-        self.parser = YamlFieldParser(self.config)
-
-    def _create_test_config(self) -> ProtocolConfig:
-        """创建测试用的协议配置"""
-        config_data = {
-            "meta": {"protocol": "test", "version": 1, "default_endian": "LE"},
-            "types": {
-                "uint16": {"base": "uint", "bytes": 2},
-            },
-            "enums": {
-                "status": {0: "关闭", 1: "开启", 2: "故障"},
-                "mode": {1: "自动模式", 2: "手动模式", 3: "维护模式"},
-            },
-            "cmds": {},
-            "compatibility": {
-                "head_len": 11,
-                "tail_len": 2,
-                "frame_head": "AA F5",
-                "head_fields": [],
-            },
-        }
-        return yaml_loader._parse_config(config_data)
+    CONFIG_DATA = {
+        "meta": {"protocol": "test", "version": 1, "default_endian": "LE"},
+        "types": {
+            "uint16": {"base": "uint", "bytes": 2},
+        },
+        "enums": {
+            "status": {0: "关闭", 1: "开启", 2: "故障"},
+            "mode": {1: "自动模式", 2: "手动模式", 3: "维护模式"},
+        },
+        "cmds": {},
+        "compatibility": {
+            "head_len": 11,
+            "tail_len": 2,
+            "frame_head": "AA F5",
+            "head_fields": [],
+        },
+    }
 
     def test_scale_factor(self):
         """测试缩放因子"""
         # 原始值 1000，缩放因子 0.1，期望结果 100.0
-        data = b"\xE8\x03"  # 1000 (小端序)
-        type_def = self.config.types["uint16"]
         field = Field(len=2, name="voltage", type="uint16", scale=0.1, unit="V")
 
-        result = self.parser._parse_uint(data, type_def, field)
-        processed = self.parser._post_process_value(result, field)
+        result = self.parser.parse_fields(b"\xE8\x03", [field])  # 1000 (小端序)
 
-        assert abs(processed - 100.0) < 0.01  # 浮点数比较
+        assert result["voltage"] == 100.0
 
     def test_scale_factor_integer(self):
         """测试整数缩放因子"""
         # 原始值 100，缩放因子 10，期望结果 1000
-        data = b"\x64\x00"  # 100 (小端序)
-        type_def = self.config.types["uint16"]
         field = Field(len=2, name="value", type="uint16", scale=10)
 
-        result = self.parser._parse_uint(data, type_def, field)
-        processed = self.parser._post_process_value(result, field)
+        result = self.parser.parse_fields(b"\x64\x00", [field])  # 100 (小端序)
 
-        assert processed == 1000.0
+        assert result["value"] == 1000.0
 
     def test_scale_factor_small(self):
         """测试小数缩放因子"""
         # 原始值 12345，缩放因子 0.01，期望结果 123.45
-        data = b"\x39\x30"  # 12345 (小端序)
-        type_def = self.config.types["uint16"]
         field = Field(len=2, name="value", type="uint16", scale=0.01)
 
-        result = self.parser._parse_uint(data, type_def, field)
-        processed = self.parser._post_process_value(result, field)
+        result = self.parser.parse_fields(b"\x39\x30", [field])  # 12345 (小端序)
 
-        assert abs(processed - 123.45) < 0.001
+        assert result["value"] == 123.45
 
     def test_enum_mapping(self):
         """测试枚举映射"""
-        data = b"\x01\x00"  # 1 (小端序)
-        type_def = self.config.types["uint16"]
         field = Field(len=2, name="status", type="uint16", enum="status")
 
-        result = self.parser._parse_uint(data, type_def, field)
-        processed = self.parser._post_process_value(result, field)
+        result = self.parser.parse_fields(b"\x01\x00", [field])  # 1 (小端序)
 
-        assert isinstance(processed, dict)
-        assert processed["value"] == 1
-        assert processed["name"] == "开启"
+        assert result["status"] == {"value": 1, "name": "开启"}
 
     def test_enum_mapping_unknown_value(self):
         """测试未知枚举值"""
-        data = b"\x05\x00"  # 5 (不在枚举中)
-        type_def = self.config.types["uint16"]
         field = Field(len=2, name="status", type="uint16", enum="status")
 
-        result = self.parser._parse_uint(data, type_def, field)
-        processed = self.parser._post_process_value(result, field)
+        result = self.parser.parse_fields(b"\x05\x00", [field])  # 5 (不在枚举中)
 
         # 未知值不进行枚举映射
-        assert processed == 5
+        assert result["status"] == 5
+
+    def test_scale_with_enum(self):
+        """测试同时有缩放和枚举时，命中枚举的值按原始值映射"""
+        field = Field(len=2, name="mode", type="uint16", scale=0.1, enum="mode")
+
+        assert self.parser.parse_fields(b"\x02\x00", [field]) == {
+            "mode": {"value": 2, "name": "手动模式"}
+        }
+        assert self.parser.parse_fields(b"\x05\x00", [field]) == {"mode": 0.5}
 
     def test_no_post_processing(self):
         """测试无需后处理的字段"""
-        data = b"\x64\x00"  # 100
-        type_def = self.config.types["uint16"]
         field = Field(len=2, name="value", type="uint16")
 
-        result = self.parser._parse_uint(data, type_def, field)
-        processed = self.parser._post_process_value(result, field)
+        result = self.parser.parse_fields(b"\x64\x00", [field])  # 100
 
-        assert processed == 100
+        assert result["value"] == 100
 
-    def test_get_decimal_places(self):
+    def test_decimal_places(self):
         """测试获取小数位数"""
-        assert self.parser._get_decimal_places(0) == 0
-        assert self.parser._get_decimal_places(0.1) == 1
-        assert self.parser._get_decimal_places(0.01) == 2
-        assert self.parser._get_decimal_places(0.001) == 3
-        assert self.parser._get_decimal_places(1.0) == 0
-        assert self.parser._get_decimal_places(10) == 0
+        assert _decimal_places(0) == 0
+        assert _decimal_places(0.1) == 1
+        assert _decimal_places(0.01) == 2
+        assert _decimal_places(0.001) == 3
+        assert _decimal_places(1.0) == 0
+        assert _decimal_places(10) == 0
+
+    @pytest.mark.parametrize(
+        "scale,expected", [(0.1, 1234.5), (0.01, 123.45), (0.001, 12.345), (10, 123450.0)]
+    )
+    def test_scale_rounds_to_scale_places(self, scale, expected):
+        """测试缩放结果按 scale 的小数位数四舍五入"""
+        field = Field(len=2, name="value", type="uint16", scale=scale)
+
+        result = self.parser.parse_fields(b"\x39\x30", [field])
+
+        assert result["value"] == expected
+
+    def test_invalid_scale_only_fails_its_field(self):
+        """测试无法处理的缩放因子只让该字段回退为十六进制，后续字段正常解析"""
+        fields = [
+            Field(len=2, name="v", type="uint16", scale="0.1"),
+            Field(len=2, name="x", type="uint16"),
+        ]
+
+        result = self.parser.parse_fields(b"\x39\x30\x05\x00", fields)
+
+        assert result == {"v": "3930", "x": 5}
+
+    @pytest.mark.parametrize("scale", [0.1, 0.015, 0.125, 3.3, 100, 1e-12])
+    @pytest.mark.parametrize("raw_value", [0, 7, -12345, 4294967295, 18446744073709551615])
+    def test_scale_value_matches_decimal(self, scale, raw_value):
+        """测试整数快速缩放与 Decimal 精确计算结果一致"""
+        places = _decimal_places(scale)
+        expected = float(
+            (Decimal(str(raw_value)) * Decimal(str(scale))).quantize(
+                Decimal(10) ** -places, rounding=ROUND_HALF_UP
+            )
+        )
+
+        assert _scale_value(raw_value, _scale_quantize_params(scale)) == expected
 
 
 class TestFieldGroups:
@@ -991,6 +967,46 @@ class TestFieldGroups:
         assert result["item_list"][1]["item"] == 2
         assert result["item_list"][2]["item"] == 3
 
+    @pytest.mark.parametrize(
+        "endian,data",
+        [("LE", b"\x01\x00\x02\x00\x34\x12"), ("BE", b"\x00\x01\x00\x02\x12\x34")],
+    )
+    def test_parse_int_array_group(self, endian, data):
+        """测试单个整数字段的循环组批量解包"""
+        fields = [
+            Group(repeat_const=3, fields=[Field(len=2, name="item", type="uint16", endian=endian)]),
+            Field(len=1, name="tail", type="uint8"),
+        ]
+
+        result = self.parser.parse_fields(data + b"\x7F", fields)
+
+        assert result["item_list"] == [{"item": 1}, {"item": 2}, {"item": 0x1234}]
+        assert result["tail"] == 0x7F
+
+    def test_leading_fields_size_stops_at_group(self):
+        """测试开头固定长度字段的总长度只统计到第一个字段组"""
+        fields = [
+            Field(len=1, name="count", type="uint8", id="count"),
+            Field(len=2, name="value", type="uint16"),
+            Group(repeat_by="count", fields=[Field(len=1, name="item", type="uint8")]),
+            Field(len=2, name="tail", type="uint16"),
+        ]
+
+        assert self.parser._leading_fields_size(fields) == 3
+        result = self.parser.parse_fields(b"\x02\x34\x12\x05\x06\x78\x56", fields)
+        assert result["value"] == 0x1234
+        assert result["item_list"] == [{"item": 5}, {"item": 6}]
+        assert result["tail"] == 0x5678
+
+    def test_parse_int_array_group_insufficient_data(self):
+        """测试整数循环组数据不足时逐项解析并使用占位信息"""
+        fields = [Group(repeat_const=3, fields=[Field(len=2, name="item", type="uint16")])]
+
+        result = self.parser.parse_fields(b"\x01\x00\x02\x00", fields)
+
+        assert result["item_list"][:2] == [{"item": 1}, {"item": 2}]
+        assert result["item_list"][2]["item"] == MISSING_FIELD_PLACEHOLDER
+
     def test_parse_field_with_repeat_by(self):
         """测试解析动态次数循环的字段组"""
         # 创建数据：count=3, items=[1, 2, 3]
@@ -1094,6 +1110,32 @@ class TestFieldGroups:
         size = self.parser._calculate_field_size(group, context)
         assert size == 10  # 5 * 2字节
 
+    def test_static_group_size_cached(self):
+        """测试配置持有的固定大小字段组（含嵌套组）在初始化时预先计算大小"""
+        inner = Group(repeat_const=2, fields=[Field(len=1, name="b", type="uint8")])
+        group = Group(repeat_const=3, fields=[Field(len=2, name="a", type="uint16"), inner])
+        self.config.cmds[1] = [group]
+        parser = YamlFieldParser(self.config)
+
+        assert parser._static_sizes[id(group)] == (group, 12)  # 3 * (2 + 2 * 1)
+        assert parser._static_sizes[id(inner)] == (inner, 2)
+        assert parser._calculate_field_size(group, {}) == 12
+
+    def test_temporary_group_not_cached(self):
+        """测试调用方临时构造的字段组按需计算，不进入缓存"""
+        group = Group(repeat_const=3, fields=[Field(len=2, name="a", type="uint16")])
+
+        assert self.parser._calculate_field_size(group, {}) == 6
+        assert id(group) not in self.parser._static_sizes
+
+    def test_group_with_dynamic_nested_group_not_static(self):
+        """测试含动态嵌套组的字段组按上下文计算大小"""
+        inner = Group(repeat_by="count", fields=[Field(len=1, name="b", type="uint8")])
+        group = Group(repeat_const=2, fields=[inner])
+
+        assert self.parser._get_static_size(group) is None
+        assert self.parser._calculate_field_size(group, {"count": 4}) == 8
+
 
 class TestFieldParsingIntegration:
     """测试字段解析集成功能"""
@@ -1146,6 +1188,82 @@ class TestFieldParsingIntegration:
         assert abs(result["voltage"] - 27.8) < 0.1
         assert result["current"] == 5000
 
+    def test_field_parser_compiled_once(self):
+        """测试配置持有的字段在初始化时编译一次，后续解析复用"""
+        field = Field(len=2, name="current", type="uint16")
+        fields = [field]
+        self.config.cmds[1] = fields
+        parser = YamlFieldParser(self.config)
+        compiled = parser._field_parsers[id(field)]
+        plan = parser._fields_plans[id(fields)]
+
+        first = parser.parse_fields(b"\x88\x13", fields)
+        second = parser.parse_fields(b"\x89\x13", fields)
+
+        assert first["current"] == 5000
+        assert second["current"] == 5001
+        assert parser._field_parsers[id(field)] is compiled
+        assert parser._fields_plans[id(fields)] is plan
+
+    def test_temporary_fields_not_cached(self):
+        """测试临时传入的字段列表每次现场编译，缓存不会持有它们"""
+        field = Field(len=2, name="current", type="uint16")
+        fields = [field]
+
+        assert self.parser.parse_fields(b"\x88\x13", fields) == {"current": 5000}
+        assert id(field) not in self.parser._field_parsers
+        assert id(fields) not in self.parser._fields_plans
+        assert id(fields) not in self.parser._leading_sizes
+
+    def test_consecutive_int_fields_merged(self):
+        """测试端序相同的连续整数字段合并为一次解包，枚举/缩放字段单独解析"""
+        fields = [
+            Field(len=1, name="a", type="uint8", id="a"),
+            Field(len=2, name="b", type="int16"),
+            Field(len=2, name="c", type="uint16", endian="BE"),
+            Field(len=2, name="d", type="uint16", endian="BE"),
+            Field(len=1, name="status", type="uint8", enum="status"),
+        ]
+        context = {}
+
+        result = self.parser.parse_fields(b"\x05\xFF\xFF\x12\x34\x00\x01\x01", fields, context)
+
+        assert result == {
+            "a": 5,
+            "b": -1,
+            "c": 0x1234,
+            "d": 1,
+            "status": {"value": 1, "name": "在线"},
+        }
+        assert context == {"a": 5}
+        plan = self.parser._get_fields_plan(fields)
+        assert [len(segment.names) for segment in plan[:2]] == [2, 2]
+        assert plan[2] == [fields[4]]
+
+    def test_consecutive_int_fields_insufficient_data(self):
+        """测试合并解包段数据不足时逐字段解析并使用占位信息"""
+        fields = [
+            Field(len=1, name="a", type="uint8"),
+            Field(len=2, name="b", type="uint16"),
+            Field(len=2, name="c", type="uint16"),
+        ]
+
+        result = self.parser.parse_fields(b"\x05\x34\x12\x01", fields)
+
+        assert result == {"a": 5, "b": 0x1234, "c": MISSING_FIELD_PLACEHOLDER}
+
+    def test_parse_enum_field_unknown_value(self):
+        """测试枚举字段遇到未定义的值时返回原始值"""
+        fields = [
+            Field(len=1, name="status", type="uint8", enum="status"),
+            Field(len=1, name="fault", type="uint8", enum="status"),
+        ]
+
+        result = self.parser.parse_fields(b"\x02\x09", fields)
+
+        assert result["status"] == {"value": 2, "name": "故障"}
+        assert result["fault"] == 9
+
     def test_parse_field_insufficient_data(self):
         """测试字段数据不足"""
         data = b"\x01\xDC"  # 只有2字节，但需要5字节
@@ -1197,59 +1315,6 @@ class TestFieldParsingIntegration:
         assert name == "inner_field"
 
 
-class TestStructCaching:
-    """测试struct缓存机制"""
-
-    def setup_method(self):
-        """设置测试环境"""
-        config_data = {
-            "meta": {"protocol": "test", "version": 1, "default_endian": "LE"},
-            "types": {
-                "uint8": {"base": "uint", "bytes": 1},
-                "uint16": {"base": "uint", "bytes": 2},
-            },
-            "enums": {},
-            "cmds": {},
-            "compatibility": {
-                "head_len": 11,
-                "tail_len": 2,
-                "frame_head": "AA F5",
-                "head_fields": [],
-            },
-        }
-        self.config = yaml_loader._parse_config(config_data)
-        self.parser = YamlFieldParser(self.config)
-
-    def test_struct_caching(self):
-        """测试struct对象缓存"""
-        # 第一次调用
-        struct1 = self.parser._get_struct("LE", "H", 2)
-        # 第二次调用（应该返回缓存的对象）
-        struct2 = self.parser._get_struct("LE", "H", 2)
-
-        assert struct1 is struct2  # 应该是同一个对象
-
-    def test_struct_cache_different_keys(self):
-        """测试不同key返回不同struct对象"""
-        struct1 = self.parser._get_struct("LE", "H", 2)
-        struct2 = self.parser._get_struct("BE", "H", 2)
-
-        assert struct1 is not struct2
-
-    def test_struct_cache_initially_empty(self):
-        """测试初始缓存为空"""
-        assert len(self.parser._struct_cache) == 0
-
-    def test_struct_cache_populates(self):
-        """测试缓存会被填充"""
-        self.parser._get_struct("LE", "B", 1)
-        self.parser._get_struct("LE", "H", 2)
-
-        assert len(self.parser._struct_cache) == 2
-        assert ("LE", "B", 1) in self.parser._struct_cache
-        assert ("LE", "H", 2) in self.parser._struct_cache
-
-
 class TestBytesToIntConversion:
     """测试字节到整数转换"""
 
@@ -1301,48 +1366,48 @@ class TestBytesToIntConversion:
         assert result == 0
 
 
+@pytest.mark.usefixtures("class_parser")
 class TestBcdConversion:
-    """测试BCD转换辅助函数"""
-
-    def setup_method(self):
-        """设置测试环境"""
-        config_data = {
-            "meta": {"protocol": "test", "version": 1, "default_endian": "LE"},
-            "types": {},
-            "enums": {},
-            "cmds": {},
-            "compatibility": {
-                "head_len": 11,
-                "tail_len": 2,
-                "frame_head": "AA F5",
-                "head_fields": [],
-            },
-        }
-        self.config = yaml_loader._parse_config(config_data)
-        self.parser = YamlFieldParser(self.config)
-
-    def test_bcd_byte_to_int_valid(self):
-        """测试有效的BCD字节转换"""
-        assert self.parser._bcd_byte_to_int(0x12) == 12
-        assert self.parser._bcd_byte_to_int(0x34) == 34
-        assert self.parser._bcd_byte_to_int(0x00) == 0
-        assert self.parser._bcd_byte_to_int(0x99) == 99
-
-    def test_bcd_byte_to_int_invalid(self):
-        """测试无效的BCD字节转换"""
-        with pytest.raises(ValueError, match="无效BCD字节"):
-            self.parser._bcd_byte_to_int(0xAB)
+    """测试BCD字节经 parse_fields 的转换结果"""
+
+    CONFIG_DATA = {
+        "meta": {"protocol": "test", "version": 1, "default_endian": "LE"},
+        "types": {
+            "bcd": {"base": "bcd"},
+            "bcd_time7": {"base": "time.bcd7"},
+        },
+        "enums": {},
+        "cmds": {},
+        "compatibility": {
+            "head_len": 11,
+            "tail_len": 2,
+            "frame_head": "AA F5",
+            "head_fields": [],
+        },
+    }
+
+    def test_bcd_multi_bytes(self):
+        """测试多字节BCD转换"""
+        fields = [Field(len=3, name="value", type="bcd")]
 
-        with pytest.raises(ValueError, match="无效BCD字节"):
-            self.parser._bcd_byte_to_int(0x0F)
+        assert self.parser.parse_fields(b"\x01\x02\x03", fields) == {"value": "010203"}
 
-    def test_bcd_to_int_multi_bytes(self):
-        """测试多字节BCD转换"""
-        # 0x1234 -> 1234
-        assert self.parser._bcd_to_int(b"\x12\x34") == 1234
+    @pytest.mark.parametrize(
+        "data,expected",
+        [
+            (bytes.fromhex("20240115123045"), "2024-01-15 12:30:45"),
+            (bytes.fromhex("99991231235959"), "9999-12-31 23:59:59"),
+            # 含无效BCD字节（0xAB、0x0F）时回退为十六进制
+            (bytes.fromhex("2024AB15123045"), "2024AB15123045"),
+            (bytes.fromhex("20240F15123045"), "20240F15123045"),
+        ],
+        ids=["valid", "max_digits", "invalid_both_nibbles", "invalid_low_nibble"],
+    )
+    def test_bcd_time_bytes(self, data, expected):
+        """测试BCD时间逐字节转换，无效字节整体回退为十六进制"""
+        fields = [Field(len=7, name="time", type="bcd_time7")]
 
-        # 0x010203 -> 10203
-        assert self.parser._bcd_to_int(b"\x01\x02\x03") == 10203
+        assert self.parser.parse_fields(data, fields) == {"time": expected}
 
 
 class TestExceptions:
@@ -1408,9 +1473,8 @@ class TestExceptions:
         # 手动设置不支持的类型
         self.config.types["custom_type"] = type_def
 
-        # 直接调用 _parse_by_type 方法会抛出异常
-        with pytest.raises(ValueError, match="Unsupported type base: unsupported_base"):
-            self.parser._parse_by_type(data, type_def, field)
+        # 解析失败的字段回退为十六进制
+        assert self.parser.parse_fields(data, [field]) == {"test": "01020304"}
 
     def test_insufficient_data_for_field_parsing(self):
         """测试字段数据长度不足"""
@@ -1422,14 +1486,6 @@ class TestExceptions:
         # 数据不足时应该使用占位符
         assert result["voltage"] == MISSING_FIELD_PLACEHOLDER
 
-    def test_invalid_bcd_byte(self):
-        """测试无效的BCD字节"""
-        with pytest.raises(ValueError, match="无效BCD字节: 0xAB"):
-            self.parser._bcd_byte_to_int(0xAB)
-
-        with pytest.raises(ValueError, match="无效BCD字节: 0x0F"):
-            self.parser._bcd_byte_to_int(0x0F)
-
     def test_bcd_time7_insufficient_bytes(self):
         """测试BCD时间7字节不足"""
         data = b"\x20\x24\x01"  # 只有3字节，需要7字节
@@ -10,13 +10,16 @@ import pytest
 
 from src.yaml_unified_protocol import YamlUnifiedProtocol
 
+# 过滤器测试共用的时间范围
+_TIME_RANGE_2024 = (datetime(2024, 1, 1), datetime(2024, 12, 31))
+
 
 class TestYamlUnifiedProtocolInit:
     """测试 YamlUnifiedProtocol 初始化"""
 
-    def test_init(self, sample_protocol_config, sample_log_file):
+    def test_init(self, sample_protocol_config, sample_log_file, shared_protocol):
         """测试初始化"""
-        protocol = YamlUnifiedProtocol(sample_log_file, sample_protocol_config)
+        protocol = shared_protocol
 
         assert protocol.log_file_name == sample_log_file
         assert protocol.protocol_yaml_path == sample_protocol_config
@@ -26,11 +29,17 @@ class TestYamlUnifiedProtocolInit:
         assert protocol.parser is not None
         assert protocol.formatter is not None
 
-    def test_init_loads_config(self, sample_protocol_config, sample_log_file):
+    def test_init_loads_config(self, shared_protocol):
         """测试初始化时加载配置"""
-        protocol = YamlUnifiedProtocol(sample_log_file, sample_protocol_config)
+        assert shared_protocol.yaml_config.meta.protocol == "v8"
 
-        assert protocol.yaml_config.meta.protocol == "v8"
+    def test_instances_share_cached_config(self, sample_protocol_config, sample_log_file):
+        """测试多个实例复用同一份已加载配置，字段解析器不重复创建"""
+        first = YamlUnifiedProtocol(sample_log_file, sample_protocol_config)
+        second = YamlUnifiedProtocol(sample_log_file, sample_protocol_config)
+
+        assert second.yaml_config is first.yaml_config
+        assert second.field_parser is second.yaml_format.field_parser
 
 
 class TestProgressCallbacks:
@@ -67,45 +76,39 @@ class TestProgressCallbacks:
 class TestCommandFilters:
     """测试命令过滤"""
 
-    def test_set_include_cmds(self, sample_protocol_config, sample_log_file):
-        """测试设置包含命令"""
+    @pytest.mark.parametrize(
+        "setter,attr,cmd_list",
+        [
+            ("set_include_cmds", "_include_cmds", [1, 2, 3]),
+            ("set_exclude_cmds", "_exclude_cmds", [4, 5, 6]),
+        ],
+        ids=["include_cmds", "exclude_cmds"],
+    )
+    def test_cmd_filter_setter(
+        self, sample_protocol_config, sample_log_file, setter, attr, cmd_list
+    ):
+        """测试设置命令过滤器（通过检查 parser 的过滤器验证设置成功）"""
         protocol = YamlUnifiedProtocol(sample_log_file, sample_protocol_config)
 
-        cmd_list = [1, 2, 3]
-        protocol.set_include_cmds(cmd_list)
-
-        # 验证设置成功（通过检查 parser 的过滤器）
-        assert protocol.parser._include_cmds == cmd_list
+        getattr(protocol, setter)(cmd_list)
 
-    def test_set_exclude_cmds(self, sample_protocol_config, sample_log_file):
-        """测试设置排除命令"""
-        protocol = YamlUnifiedProtocol(sample_log_file, sample_protocol_config)
-
-        cmd_list = [4, 5, 6]
-        protocol.set_exclude_cmds(cmd_list)
-
-        assert protocol.parser._exclude_cmds == cmd_list
+        assert getattr(protocol.parser, attr) == cmd_list
 
     def test_set_time_range(self, sample_protocol_config, sample_log_file):
         """测试设置时间范围"""
         protocol = YamlUnifiedProtocol(sample_log_file, sample_protocol_config)
 
-        start_time = datetime(2024, 1, 1, 0, 0, 0)
-        end_time = datetime(2024, 12, 31, 23, 59, 59)
-
-        protocol.set_time_range(start_time, end_time)
+        protocol.set_time_range(*_TIME_RANGE_2024)
 
-        assert protocol.parser._time_range == (start_time, end_time)
+        assert protocol.parser._time_range == _TIME_RANGE_2024
 
 
 class TestExtractDataFromFile:
     """测试从文件提取数据"""
 
-    def test_extract_data_from_file(self, sample_protocol_config, sample_log_file):
+    def test_extract_data_from_file(self, sample_log_file, shared_protocol):
         """测试提取数据"""
-        protocol = YamlUnifiedProtocol(sample_log_file, sample_protocol_config)
-
-        data_groups = protocol.extract_data_from_file(sample_log_file)
+        data_groups = shared_protocol.extract_data_from_file(sample_log_file)
 
         assert len(data_groups) > 0
         assert "time" in data_groups[0]
@@ -142,12 +145,20 @@ class TestParseDataContent:
         # 设置包含过滤器
         protocol.set_include_cmds([1])
 
-        data_groups = protocol.extract_data_from_file(sample_log_file)
+        # 直接构造 cmd1 与 cmd2 的数据组，无需读取日志文件
+        data_groups = [
+            {
+                "time": "2024-01-28 10:30:45.123",
+                "direction": "Send",
+                "terminal_id": 1,
+                "data": f"AA F5 00 00 {cmd:02X} 00 00 00 01 02 03 00 00",
+            }
+            for cmd in (1, 2)
+        ]
         parsed_data = protocol.parse_data_content(data_groups)
 
         # 验证只有命令ID为1的数据被解析
-        for item in parsed_data:
-            assert item.get("cmd") == 1
+        assert [item["cmd"] for item in parsed_data] == [1]
 
 
 class TestScreenParseData:
@@ -179,24 +190,19 @@ class TestScreenParseData:
         }
 
         # 保存到临时目录
-        os.makedirs(os.path.join(tmp_path, "parsed_log"), exist_ok=True)
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
+        output_dir = str(tmp_path / "parsed_log")
+        output_path = protocol.screen_parse_data(parse_data, output_dir=output_dir)
 
-        try:
-            output_path = protocol.screen_parse_data(parse_data)
+        assert output_path is not None
+        assert os.path.exists(output_path)
+        assert os.path.dirname(output_path) == output_dir
 
-            assert output_path is not None
-            assert os.path.exists(output_path)
+        # 验证文件内容
+        with open(output_path, "r", encoding="utf-8") as f:
+            content = f.read()
 
-            # 验证文件内容
-            with open(output_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            assert "成功解析 1 条数据" in content
-            assert "field1: value1" in content
-        finally:
-            os.chdir(original_cwd)
+        assert "成功解析 1 条数据" in content
+        assert "field1: value1" in content
 
     def test_screen_parse_data_empty(self, sample_protocol_config, sample_log_file):
         """测试空数据"""
@@ -214,18 +220,11 @@ class TestRun:
         """测试成功运行"""
         protocol = YamlUnifiedProtocol(sample_log_file, sample_protocol_config)
 
-        # 临时切换到临时目录
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-
-        try:
-            output_path = protocol.run()
+        output_path = protocol.run(output_dir=str(tmp_path / "parsed_log"))
 
-            # 验证输出文件
-            if output_path:
-                assert os.path.exists(output_path)
-        finally:
-            os.chdir(original_cwd)
+        # 验证输出文件
+        if output_path:
+            assert os.path.exists(output_path)
 
     def test_run_with_stop(self, sample_protocol_config, sample_log_file, tmp_path):
         """测试中途停止"""
@@ -234,16 +233,12 @@ class TestRun:
         # 设置立即停止
         protocol.set_should_stop(True)
 
-        original_cwd = os.getcwd()
-        os.chdir(tmp_path)
-
-        try:
-            output_path = protocol.run()
+        output_dir = tmp_path / "parsed_log"
+        output_path = protocol.run(output_dir=str(output_dir))
 
-            # 被停止应该返回 None
-            assert output_path is None
-        finally:
-            os.chdir(original_cwd)
+        # 被停止应该返回 None，且不生成输出文件
+        assert output_path is None
+        assert not output_dir.exists()
 
 
 class TestBackwardCompatibility:
@@ -263,7 +258,7 @@ class TestBackwardCompatibility:
         # 测试旧的过滤器接口
         protocol.set_include_cmds([1, 2])
         protocol.set_exclude_cmds([3, 4])
-        protocol.set_time_range(datetime(2024, 1, 1), datetime(2024, 12, 31))
+        protocol.set_time_range(*_TIME_RANGE_2024)
 
         # 测试旧的进度回调接口
         progress_updates = []
@@ -274,7 +269,17 @@ class TestBackwardCompatibility:
 
 
 # Fixtures
-@pytest.fixture
+# V8协议的帧头是 AA F5，不是 68 68
+_SAMPLE_LOG_CONTENT = """
+2024-01-28 10:30:45.123 Send [1] TX:
+AA F5 01 00 64 68 04 08 00 01 02 03 04 05 06 07 08 16
+
+2024-01-28 10:30:46.456 Recv [2] RX:
+AA F5 02 00 32 68 28 08 00 01 02 03 04 05 06 07 08 09 0A 0B 0C 0D 0E 0F 10 11 12 13 14 15 16 17 18 D8
+"""
+
+
+@pytest.fixture(scope="session")
 def sample_protocol_config():
     """获取示例协议配置文件路径"""
     # 使用项目中的实际配置文件
@@ -285,21 +290,23 @@ def sample_protocol_config():
         pytest.skip(f"示例配置文件不存在: {config_path}")
 
 
-@pytest.fixture
-def sample_log_file(tmp_path):
-    """创建示例日志文件"""
-    # V8协议的帧头是 AA F5，不是 68 68
-    content = """
-2024-01-28 10:30:45.123 Send [1] TX:
-AA F5 01 00 64 68 04 08 00 01 02 03 04 05 06 07 08 16
-
-2024-01-28 10:30:46.456 Recv [2] RX:
-AA F5 02 00 32 68 28 08 00 01 02 03 04 05 06 07 08 09 0A 0B 0C 0D 0E 0F 10 11 12 13 14 15 16 17 18 D8
-"""
-    log_file = tmp_path / "test.log"
-    log_file.write_text(content, encoding="utf-8")
+@pytest.fixture(scope="session")
+def sample_log_file(tmp_path_factory):
+    """创建示例日志文件（整个测试会话只写一次，测试不得修改该文件）"""
+    log_file = tmp_path_factory.mktemp("logs") / "test.log"
+    log_file.write_text(_SAMPLE_LOG_CONTENT, encoding="utf-8")
     return str(log_file)
 
 
+@pytest.fixture(scope="session")
+def shared_protocol(sample_protocol_config, sample_log_file):
+    """会话级共享的协议实例
+
+    仅供不修改实例状态（过滤器、停止标志、回调等）的测试使用，
+    需要修改状态的测试仍各自创建实例，避免用例之间相互影响。
+    """
+    return YamlUnifiedProtocol(sample_log_file, sample_protocol_config)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -66,7 +66,13 @@ import re
 import os
 import sys
 import argparse
-from typing import Dict, List, Set, Tuple, Optional
+from itertools import accumulate
+from typing import Dict, Iterator, List, Set, Tuple, Optional
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML 未带 libyaml 扩展时回退到纯Python实现
+    from yaml import SafeLoader as _YamlLoader
 
 # 设置输出编码和文件系统编码处理
 if sys.platform == 'win32':
@@ -77,6 +83,63 @@ if sys.platform == 'win32':
     # 设置环境变量以支持UTF-8
     os.environ['PYTHONIOENCODING'] = 'utf-8'
 
+# 预编译正则表达式（文档逐行扫描时反复使用，避免每次调用时查找 re 模块缓存）
+# 文档格式检测与CMD定位
+_FRAME_TYPE_RE = re.compile(r'\|\s*帧类型码\s*\|\s*0x([0-9A-Fa-f]+)')
+# 整篇文档 finditer 用的单行版本：空白不跨越换行，与逐行匹配结果一致
+_FRAME_TYPE_LINE_RE = re.compile(r'\|[^\S\n]*帧类型码[^\S\n]*\|[^\S\n]*0x([0-9A-Fa-f]+)')
+_CMD_ANCHOR_RE = re.compile(r'<a id="cmd-(\d+)"></a>')
+_ANY_ANCHOR_RE = re.compile(r'<a id="[^"]*"></a>')
+_SHENGHONG_TITLE_RE = re.compile(r'### \d+\.\d+.*\(cmd=\d+\)', re.IGNORECASE)
+_V8_TITLE_RE = re.compile(r'### [^(]+\(cmd=\d+\)', re.IGNORECASE)
+_ANCHOR_TITLE_LINE_RE = re.compile(r'^\s*### .*\(cmd=\d+\)', re.IGNORECASE)
+_LEGACY_CMD_HEADER_RE = re.compile(
+    r'^\s*(#{0,4})\s*(\d+\.\d+(?:\.\d+)*)\s*\(CMD=(\d+)\)', re.IGNORECASE
+)
+# 段落边界（标题行）
+_HEADING_RE = re.compile(r'^\s*#{1,4}')
+_MAJOR_SECTION_RE = re.compile(r'^\s*#{1,2}\s+\d+\.\d+')
+_SUB_HEADING_RE = re.compile(r'^\s*#{2,4}\s+.+')
+_TOP_HEADING_RE = re.compile(r'^\s*#{1,2}\s+.+')
+_SECTION_TITLE_LINE_RE = re.compile(r'^\s*#{1,3}\s+.+')
+_SECTION_TITLE_RE = re.compile(r'#{1,3}\s+(.+)')
+_LEGACY_MAIN_SECTION_RE = re.compile(r'^\s*\d+\.\d+\s+\w+')
+# 命令名称提取
+_CMD_NAME_RE = re.compile(r'###\s*([^(（]+)')
+_SHENGHONG_NAME_RE = re.compile(r'### \d+\.\d+(?:\.\d+)?\s*\(cmd=\d+\)\s*(.+)', re.IGNORECASE)
+_CMD_SUFFIX_NAME_RE = re.compile(r'\(cmd=\d+\)\s*(.+)', re.IGNORECASE)
+_V8_NAME_RE = re.compile(r'###\s*([^(]+)\(cmd=\d+\)', re.IGNORECASE)
+_GENERIC_NAME_RE = re.compile(r'#{1,4}\s*(.+)')
+_PARENTHESIZED_RE = re.compile(r'\([^)]*\)')
+# 字段表格
+_FIELD_TABLE_ROW_RE = re.compile(
+    r'\|\s*(\d+\*?)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*([^|]*?)\s*\|'
+)
+_YUNKUAICHONG_TABLE_ROW_RE = re.compile(
+    r'\|\s*(\d+)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*([^|]*?)\s*\|'
+)
+_DIGITS_RE = re.compile(r'\d+')
+# 字段名归一化与人工核查识别
+_TRAILING_INDEX_RE = re.compile(r'[1-9n]$')
+_SUMMARY_FIELD_RE = re.compile(r'(状态|反馈|告警|位|位图)')
+_TRAILING_NUMERAL_RE = re.compile(r'[0-9一二三四五六七八九十]+$')
+_HAS_DIGIT_RE = re.compile(r'\d')
+
+# 不应该被归一化的字段模式（独立字段）
+_INDEPENDENT_FIELD_RE = re.compile('|'.join([
+    r'停止参数\d+',      # 停止参数1-8
+    r'传感器\d+',        # 传感器1-N
+    r'通道\d+',          # 通道1-N
+    r'模块\d+',          # 模块1-N
+    r'路\d+',           # 1路、2路等
+    r'枪\d+',           # 枪1、枪2等
+    r'相\d+',           # A相、B相等（虽然不是数字，但相关）
+    r'温度\d+',         # 温度1-N
+    r'电压\d+',         # 电压1-N
+    r'电流\d+',         # 电流1-N
+    r'功率\d+',         # 功率1-N
+]))
+
 def normalize_file_path(file_path: str) -> str:
     """规范化文件路径，处理编码问题"""
     if not file_path:
@@ -126,11 +189,40 @@ def normalize_file_path(file_path: str) -> str:
     
     return file_path
 
+def iter_line_matches(pattern: re.Pattern, content: str) -> Iterator[Tuple[int, re.Match]]:
+    """对整篇文档做一次 finditer，按行号返回每行的第一个匹配
+
+    等价于对 content.split('\n') 逐行 search，但正则引擎只扫描一遍文本，
+    行号通过统计相邻两次匹配之间的换行数累加得到。pattern 不能跨行匹配。
+    """
+    line_idx = 0
+    pos = 0
+    last_line = -1
+    for match in pattern.finditer(content):
+        start = match.start()
+        line_idx += content.count('\n', pos, start)
+        pos = start
+        if line_idx != last_line:
+            last_line = line_idx
+            yield line_idx, match
+
+def line_start_offsets(lines: List[str]) -> List[int]:
+    """计算 content.split('\n') 各行在原文中的起始偏移，末尾附加 len(content) + 1"""
+    return list(accumulate((len(line) + 1 for line in lines), initial=0))
+
+def slice_lines(content: str, offsets: List[int], start: int, end: int) -> str:
+    """等价于 '\n'.join(lines[start:end])，直接对原文切片，不再复制行列表和拼接"""
+    start, end, _ = slice(start, end).indices(len(offsets) - 1)
+    if end <= start:
+        return ''
+    return content[offsets[start]:offsets[end] - 1]
+
 def load_yaml_config(config_path: str) -> Dict:
     """加载YAML配置文件"""
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        # 以二进制读取，由 PyYAML 自行识别编码
+        with open(config_path, 'rb') as f:
+            return yaml.load(f, Loader=_YamlLoader)
     except Exception as e:
         print(f"❌ 加载配置文件失败: {e}")
         return {}
@@ -138,19 +230,19 @@ def load_yaml_config(config_path: str) -> Dict:
 def detect_document_format(content: str) -> str:
     """检测文档格式类型"""
     # 检查是否为云快充格式（使用帧类型码）
-    if re.search(r'\|\s*帧类型码\s*\|\s*0x[0-9A-Fa-f]+', content):
+    if _FRAME_TYPE_RE.search(content):
         return 'yunkuaichong'
     # 检查是否有MD锚点格式的CMD定义
-    elif re.search(r'<a id="cmd-\d+"></a>', content):
+    elif _CMD_ANCHOR_RE.search(content):
         # 进一步区分盛弘和V8格式
-        if re.search(r'### \d+\.\d+.*\(cmd=\d+\)', content, re.IGNORECASE):
+        if _SHENGHONG_TITLE_RE.search(content):
             return 'shenghong'
-        elif re.search(r'### [^(]+\(cmd=\d+\)', content, re.IGNORECASE):
+        elif _V8_TITLE_RE.search(content):
             return 'v8'
         else:
             return 'anchor_based'
     # 传统盛弘格式（无锚点）
-    elif re.search(r'### \d+\.\d+.*\(CMD=\d+\)', content, re.IGNORECASE):
+    elif _SHENGHONG_TITLE_RE.search(content):
         return 'shenghong_legacy'
     else:
         return 'unknown'
@@ -158,60 +250,63 @@ def detect_document_format(content: str) -> str:
 def parse_protocol_doc(doc_path: str) -> Dict[int, Dict]:
     """解析协议文档，提取CMD定义 - 支持多种格式"""
     try:
-        with open(doc_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # 一次读入字节后整体解码，比文本模式分块解码和逐块换行转换更快
+        with open(doc_path, 'rb') as f:
+            content = f.read().decode('utf-8')
     except Exception as e:
         print(f"❌ 读取协议文档失败: {e}")
         return {}
     
+    # 与文本模式的通用换行一致：\r\n 和 \r 统一为 \n
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    
     # 检测文档格式
     doc_format = detect_document_format(content)
     print(f"🔍 检测到文档格式: {doc_format}")
     
     # 根据格式选择解析方法
     if doc_format == 'yunkuaichong':
-        return parse_yunkuaichong_protocol(content)
+        protocol_cmds = parse_yunkuaichong_protocol(content)
     elif doc_format in ['shenghong', 'v8', 'anchor_based']:
-        return parse_anchor_based_protocol(content, doc_format)
+        protocol_cmds = parse_anchor_based_protocol(content, doc_format)
     elif doc_format == 'shenghong_legacy':
-        return parse_shenghong_legacy_protocol(content)
+        protocol_cmds = parse_shenghong_legacy_protocol(content)
     else:
         print(f"⚠️  未知文档格式，尝试使用传统解析方法")
-        return parse_shenghong_legacy_protocol(content)
+        protocol_cmds = parse_shenghong_legacy_protocol(content)
+
+    return protocol_cmds
 
 def parse_anchor_based_protocol(content: str, doc_format: str) -> Dict[int, Dict]:
     """解析基于MD锚点的协议文档（盛弘和V8）"""
     protocol_cmds = {}
     lines = content.split('\n')
+    offsets = line_start_offsets(lines)
     
     # 查找所有带有 <a id="cmd-数字"></a> 锚点的CMD定义
     cmd_anchors = []
     
-    for i, line in enumerate(lines):
-        # 匹配锚点格式：<a id="cmd-001"></a> 或 <a id="cmd-1"></a>
-        anchor_match = re.search(r'<a id="cmd-(\d+)"></a>', line)
-        if anchor_match:
-            cmd_num_str = anchor_match.group(1)
-            cmd_num = int(cmd_num_str.lstrip('0') or '0')  # 处理前导零
-            
-            # 查找紧接着的标题行
-            title_line_idx = i + 1
-            if title_line_idx < len(lines):
-                title_line = lines[title_line_idx]
-                
-                # 根据文档格式匹配不同的标题模式
-                if doc_format == 'shenghong':
-                    # 盛弘格式：### 3.1.1  (cmd=1)后台服务器下发充电桩整形工作参数
-                    title_match = re.match(r'^\s*### .*\(cmd=\d+\)', title_line, re.IGNORECASE)
-                elif doc_format == 'v8':
-                    # V8格式：### 注册帧(cmd=1) [cmd=001]
-                    title_match = re.match(r'^\s*### .*\(cmd=\d+\)', title_line, re.IGNORECASE)
-                else:
-                    # 通用锚点格式
-                    title_match = re.match(r'^\s*#{1,4}', title_line)
-                
-                if title_match:
-                    cmd_anchors.append((i, cmd_num, title_line.strip(), title_line_idx))
+    # 根据文档格式确定锚点后标题行的匹配模式（循环外只判断一次）
+    if doc_format in ('shenghong', 'v8'):
+        # 盛弘格式：### 3.1.1  (cmd=1)后台服务器下发充电桩整形工作参数
+        # V8格式：### 注册帧(cmd=1) [cmd=001]
+        title_re = _ANCHOR_TITLE_LINE_RE
+    else:
+        # 通用锚点格式
+        title_re = _HEADING_RE
+    
+    # 匹配锚点格式：<a id="cmd-001"></a> 或 <a id="cmd-1"></a>
+    for i, anchor_match in iter_line_matches(_CMD_ANCHOR_RE, content):
+        cmd_num_str = anchor_match.group(1)
+        cmd_num = int(cmd_num_str.lstrip('0') or '0')  # 处理前导零
+        
+        # 查找紧接着的标题行
+        title_line_idx = i + 1
+        if title_line_idx < len(lines):
+            title_line = lines[title_line_idx]
+            if title_re.match(title_line):
+                cmd_anchors.append((i, cmd_num, title_line.strip(), title_line_idx))
     
     print(f"🔍 通过锚点找到 {len(cmd_anchors)} 个CMD定义")
     
@@ -228,8 +323,8 @@ def parse_anchor_based_protocol(content: str, doc_format: str) -> Dict[int, Dict
             for j in range(title_idx + 1, next_anchor_idx):
                 line = lines[j].strip()
                 if (
-                    re.match(r'^\s*#{1,2}\s+\d+\.\d+', line)
-                    or (re.match(r'^\s*#{2,4}\s+.+', line) and j != title_idx)
+                    _MAJOR_SECTION_RE.match(line)
+                    or (_SUB_HEADING_RE.match(line) and j != title_idx)
                 ):
                     end_line_idx = j
                     break
@@ -239,18 +334,17 @@ def parse_anchor_based_protocol(content: str, doc_format: str) -> Dict[int, Dict
                 line = lines[j].strip()
                 # 主要章节标题或新的锚点
                 if (
-                    re.match(r'^\s*#{1,2}\s+\d+\.\d+', line)
-                    or re.search(r'<a id="[^"]*"></a>', line)
+                    _MAJOR_SECTION_RE.match(line)
+                    or _ANY_ANCHOR_RE.search(line)
                     # 普通的markdown标题（如### 标题），遇到下一个标题也结束
-                    or (re.match(r'^\s*#{2,4}\s+.+', line) and j != title_idx)
+                    or (_SUB_HEADING_RE.match(line) and j != title_idx)
                 ):
                     end_line_idx = j
                     break
         
         
         # 提取段落内容
-        cmd_lines = lines[anchor_idx:end_line_idx]
-        cmd_content = '\n'.join(cmd_lines)
+        cmd_content = slice_lines(content, offsets, anchor_idx, end_line_idx)
         
         # 提取字段定义表格
         fields = extract_fields_from_table(cmd_content)
@@ -258,7 +352,6 @@ def parse_anchor_based_protocol(content: str, doc_format: str) -> Dict[int, Dict
         protocol_cmds[cmd_num] = {
             'name': extract_cmd_name_from_title(title, doc_format),
             'fields': fields,
-            'raw_content': cmd_content[:200] + '...' if len(cmd_content) > 200 else cmd_content
         }
     
     return protocol_cmds
@@ -267,29 +360,28 @@ def parse_yunkuaichong_protocol(content: str) -> Dict[int, Dict]:
     """解析云快充协议文档（基于帧类型码）"""
     protocol_cmds = {}
     lines = content.split('\n')
+    offsets = line_start_offsets(lines)
     
     # 查找所有帧类型码定义
     frame_type_sections = []
     
-    for i, line in enumerate(lines):
-        # 匹配表格中的帧类型码行：| 帧类型码      | 0x01                          |
-        frame_match = re.search(r'\|\s*帧类型码\s*\|\s*0x([0-9A-Fa-f]+)', line)
-        if frame_match:
-            hex_str = frame_match.group(1)
-            cmd_num = int(hex_str, 16)  # 十六进制转十进制
-            
-            # 向前查找章节标题
-            section_title = "未知功能"
-            for j in range(max(0, i - 10), i):
-                title_line = lines[j].strip()
-                if re.match(r'^\s*#{1,3}\s+.+', title_line):
-                    # 提取标题内容
-                    title_match = re.search(r'#{1,3}\s+(.+)', title_line)
-                    if title_match:
-                        section_title = title_match.group(1).strip()
-                        break
-            
-            frame_type_sections.append((i, cmd_num, section_title, hex_str))
+    # 匹配表格中的帧类型码行：| 帧类型码      | 0x01                          |
+    for i, frame_match in iter_line_matches(_FRAME_TYPE_LINE_RE, content):
+        hex_str = frame_match.group(1)
+        cmd_num = int(hex_str, 16)  # 十六进制转十进制
+        
+        # 向前查找章节标题
+        section_title = "未知功能"
+        for j in range(max(0, i - 10), i):
+            title_line = lines[j].strip()
+            if _SECTION_TITLE_LINE_RE.match(title_line):
+                # 提取标题内容
+                title_match = _SECTION_TITLE_RE.search(title_line)
+                if title_match:
+                    section_title = title_match.group(1).strip()
+                    break
+        
+        frame_type_sections.append((i, cmd_num, section_title, hex_str))
     
     print(f"🔍 通过帧类型码找到 {len(frame_type_sections)} 个CMD定义")
     
@@ -306,14 +398,13 @@ def parse_yunkuaichong_protocol(content: str) -> Dict[int, Dict]:
             # 查找下一个主要章节
             for j in range(line_idx + 1, len(lines)):
                 line = lines[j].strip()
-                if re.match(r'^\s*#{1,2}\s+.+', line):
+                if _TOP_HEADING_RE.match(line):
                     end_line_idx = j
                     break
         
         # 提取段落内容
         start_idx = max(0, line_idx - 20)  # 向前扩展以包含完整表格
-        cmd_lines = lines[start_idx:end_line_idx]
-        cmd_content = '\n'.join(cmd_lines)
+        cmd_content = slice_lines(content, offsets, start_idx, end_line_idx)
         
         # 提取字段定义表格
         fields = extract_yunkuaichong_fields(cmd_content)
@@ -321,7 +412,6 @@ def parse_yunkuaichong_protocol(content: str) -> Dict[int, Dict]:
         protocol_cmds[cmd_num] = {
             'name': title,
             'fields': fields,
-            'raw_content': cmd_content[:200] + '...' if len(cmd_content) > 200 else cmd_content
         }
     
     return protocol_cmds
@@ -330,6 +420,7 @@ def parse_shenghong_legacy_protocol(content: str) -> Dict[int, Dict]:
     """解析传统盛弘协议文档（原有解析逻辑）"""
     protocol_cmds = {}
     lines = content.split('\n')
+    offsets = line_start_offsets(lines)
     
     # 原有的解析逻辑 - 查找所有CMD标题行
     cmd_headers = []
@@ -340,8 +431,7 @@ def parse_shenghong_legacy_protocol(content: str) -> Dict[int, Dict]:
         # 1. ### 3.2.14  (CMD=123)充电桩具体告警信息上报
         # 2. 3.1.1  (CMD=1)后台服务器下发充电桩整形工作参数
         # 3. #### 3.1.1  (CMD=1)后台服务器下发充电桩整形工作参数
-        cmd_pattern = r'^\s*(#{0,4})\s*(\d+\.\d+(?:\.\d+)*)\s*\(CMD=(\d+)\)'
-        match = re.match(cmd_pattern, line, re.IGNORECASE)
+        match = _LEGACY_CMD_HEADER_RE.match(line)
         if match:
             hash_prefix, section_num, cmd_num_str = match.groups()
             cmd_num = int(cmd_num_str)
@@ -368,17 +458,16 @@ def parse_shenghong_legacy_protocol(content: str) -> Dict[int, Dict]:
         for j in range(line_idx + 1, len(lines)):
             line = lines[j].strip()
             # 主要章节（如 3.3  充电信息数据）
-            if re.match(r'^\s*\d+\.\d+\s+\w+', line) and not line.startswith('#'):
+            if _LEGACY_MAIN_SECTION_RE.match(line) and not line.startswith('#'):
                 end_line_idx = j
                 break
             # 下一个CMD定义（任何格式）
-            elif re.match(r'^\s*#{0,4}\s*\d+\.\d+(?:\.\d+)*\s*\(CMD=\d+\)', line, re.IGNORECASE):
+            elif _LEGACY_CMD_HEADER_RE.match(line):
                 end_line_idx = j
                 break
         
         # 提取段落内容
-        cmd_lines = lines[line_idx:end_line_idx]
-        cmd_content = '\n'.join(cmd_lines)
+        cmd_content = slice_lines(content, offsets, line_idx, end_line_idx)
         
         # 提取字段定义表格
         fields = extract_fields_from_table(cmd_content)
@@ -386,7 +475,6 @@ def parse_shenghong_legacy_protocol(content: str) -> Dict[int, Dict]:
         protocol_cmds[cmd_num] = {
             'name': extract_cmd_name(cmd_content),
             'fields': fields,
-            'raw_content': cmd_content[:200] + '...' if len(cmd_content) > 200 else cmd_content
         }
     
     return protocol_cmds
@@ -397,7 +485,7 @@ def extract_cmd_name(content: str) -> str:
     for line in lines:
         if '###' in line and ('cmd=' in line.lower() or 'CMD=' in line):
             # 提取命令名称
-            name_match = re.search(r'###\s*([^(（]+)', line)
+            name_match = _CMD_NAME_RE.search(line)
             if name_match:
                 return name_match.group(1).strip()
     return "未知命令"
@@ -406,24 +494,24 @@ def extract_cmd_name_from_title(title: str, doc_format: str) -> str:
     """从标题行中提取命令名称"""
     if doc_format == 'shenghong':
         # 盛弘格式：### 3.1.1  (cmd=1)后台服务器下发充电桩整形工作参数
-        match = re.search(r'### \d+\.\d+(?:\.\d+)?\s*\(cmd=\d+\)\s*(.+)', title, re.IGNORECASE)
+        match = _SHENGHONG_NAME_RE.search(title)
         if match:
             return match.group(1).strip()
         # 备选模式：提取括号后的内容
-        match = re.search(r'\(cmd=\d+\)\s*(.+)', title, re.IGNORECASE)
+        match = _CMD_SUFFIX_NAME_RE.search(title)
         if match:
             return match.group(1).strip()
     elif doc_format == 'v8':
         # V8格式：### 注册帧(cmd=1) [cmd=001]
-        match = re.search(r'###\s*([^(]+)\(cmd=\d+\)', title, re.IGNORECASE)
+        match = _V8_NAME_RE.search(title)
         if match:
             return match.group(1).strip()
     else:
         # 通用格式：尝试提取###后的内容
-        match = re.search(r'#{1,4}\s*(.+)', title)
+        match = _GENERIC_NAME_RE.search(title)
         if match:
             # 去除括号内容
-            name = re.sub(r'\([^)]*\)', '', match.group(1)).strip()
+            name = _PARENTHESIZED_RE.sub('', match.group(1)).strip()
             return name if name else "未知命令"
     
     return "未知命令"
@@ -434,11 +522,9 @@ def extract_yunkuaichong_fields(content: str) -> List[Dict]:
     
     # 云快充使用不同的表格格式，查找参数定义表格
     # 格式：| 序号 | 参数名称 | 数据类型 | 长度(Byte) | 备注 |
-    table_pattern = r'\|\s*(\d+)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*([^|]*?)\s*\|'
-    matches = re.findall(table_pattern, content)
-    
-    for match in matches:
-        seq_num_str, field_name, data_type, length_str, description = match
+    # finditer 逐行消费匹配结果，不预先生成全部匹配的元组列表
+    for match in _YUNKUAICHONG_TABLE_ROW_RE.finditer(content):
+        seq_num_str, field_name, data_type, length_str, description = match.groups()
         try:
             seq_num = int(seq_num_str)
             
@@ -448,9 +534,9 @@ def extract_yunkuaichong_fields(content: str) -> List[Dict]:
                 length = int(length_str)
             else:
                 # 尝试从字符串中提取数字
-                length_match = re.search(r'(\d+)', length_str)
+                length_match = _DIGITS_RE.search(length_str)
                 if length_match:
-                    length = int(length_match.group(1))
+                    length = int(length_match.group())
                 else:
                     length = -1  # 未知长度
             
@@ -511,34 +597,18 @@ def normalize_repeated_field_name(field_name: str) -> str:
     """归一化重复字段名称：将'开始时间1'、'开始时间n'等归一化为'开始时间'
     但保留独立字段如'停止参数1-8'等不应该被归一化的字段"""
     
-    # 定义不应该被归一化的字段模式（独立字段）
-    INDEPENDENT_FIELD_PATTERNS = [
-        r'停止参数\d+',      # 停止参数1-8
-        r'传感器\d+',        # 传感器1-N
-        r'通道\d+',          # 通道1-N
-        r'模块\d+',          # 模块1-N
-        r'路\d+',           # 1路、2路等
-        r'枪\d+',           # 枪1、枪2等
-        r'相\d+',           # A相、B相等（虽然不是数字，但相关）
-        r'温度\d+',         # 温度1-N
-        r'电压\d+',         # 电压1-N
-        r'电流\d+',         # 电流1-N
-        r'功率\d+',         # 功率1-N
-    ]
-    
     # 检查是否匹配独立字段模式
-    for pattern in INDEPENDENT_FIELD_PATTERNS:
-        if re.match(pattern, field_name):
-            # 这是独立字段，不应该归一化
-            return field_name
+    if _INDEPENDENT_FIELD_RE.match(field_name):
+        # 这是独立字段，不应该归一化
+        return field_name
     
     # 对于其他字段，进行归一化处理
     # 只归一化明确的重复模式：如"开始时间1"、"开始时间n"等
     # 但要更保守，只处理明确的重复结构标记
-    if re.search(r'[1-9n]$', field_name):
+    if _TRAILING_INDEX_RE.search(field_name):
         # 检查是否是真正的重复结构（通常在描述中会有提示）
         # 如果字段名本身就是独特的，不要归一化
-        base_name = re.sub(r'[1-9n]$', '', field_name)
+        base_name = _TRAILING_INDEX_RE.sub('', field_name)
         
         # 如果去掉数字后的基础名称太短，可能不是重复结构
         if len(base_name) < 2:
@@ -558,11 +628,9 @@ def extract_fields_from_table(content: str) -> List[Dict]:
     # 1. 带星号的序号（如 4*、5*）
     # 2. 长度可以是数字或字母（如 1、2、N）
     # 3. 支持不同的表格分隔符
-    table_pattern = r'\|\s*(\d+\*?)\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*([^|]*?)\s*\|'
-    matches = re.findall(table_pattern, content)
-    
-    for match in matches:
-        seq_num_str, field_name, length_str, description = match
+    # finditer 逐行消费匹配结果，不预先生成全部匹配的元组列表
+    for match in _FIELD_TABLE_ROW_RE.finditer(content):
+        seq_num_str, field_name, length_str, description = match.groups()
         try:
             # 提取数字部分，忽略星号
             seq_num = int(seq_num_str.rstrip('*'))
@@ -576,7 +644,7 @@ def extract_fields_from_table(content: str) -> List[Dict]:
                 length = -1
             else:
                 # 尝试从字符串中提取数字
-                length_match = re.search(r'\d+', length_str)
+                length_match = _DIGITS_RE.search(length_str)
                 if length_match:
                     length = int(length_match.group())
                 else:
@@ -596,14 +664,11 @@ def extract_fields_from_table(content: str) -> List[Dict]:
             continue
     
     # 去重：如果有多个相同的归一化字段名，只保留第一个（重复结构的模板）
-    seen_names = set()
-    unique_fields = []
+    unique_fields = {}
     for field in fields:
-        if field['name'] not in seen_names:
-            seen_names.add(field['name'])
-            unique_fields.append(field)
+        unique_fields.setdefault(field['name'], field)
     
-    return unique_fields
+    return list(unique_fields.values())
 
 def compare_cmd_config(cmd_num: int, yaml_config: Dict, protocol_def: Dict) -> Dict:
     """对比单个CMD的配置与协议定义"""
@@ -708,27 +773,31 @@ def compare_cmd_config(cmd_num: int, yaml_config: Dict, protocol_def: Dict) -> D
         result['issues'].append(f"多余字段:\n      {extra_display}")
     
     # 对比字段长度 - 增强版，支持变长字段
+    # 按字段名预先分组协议字段，每个配置字段一次字典查找（同名协议字段按原顺序全部比对）
+    protocol_fields_by_name: Dict[str, List[Dict]] = {}
+    for protocol_field in protocol_def.get('fields', []):
+        protocol_fields_by_name.setdefault(protocol_field['name'], []).append(protocol_field)
+    
     for yaml_field in yaml_fields:
-        for protocol_field in protocol_def.get('fields', []):
-            if yaml_field['name'] == protocol_field['name']:
-                yaml_len = yaml_field['length']
-                protocol_len = protocol_field['length']
-                
-                # 处理变长字段：如果协议长度为-1（变长）而配置使用变长标识符，则认为匹配
-                is_varlen_match = (protocol_len == -1 and 
-                                 isinstance(yaml_len, str) and 
-                                 yaml_len not in ['0', '1', '2', '4', '8'])
-                
-                if yaml_len != protocol_len and not is_varlen_match:
-                    result['length_mismatches'].append({
-                        'field': yaml_field['name'],
-                        'yaml_length': yaml_len,
-                        'protocol_length': protocol_len
-                    })
-                    result['issues'].append(
-                        f"字段长度不匹配 '{yaml_field['name']}': "
-                        f"配置={yaml_len}, 协议={protocol_len}"
-                    )
+        for protocol_field in protocol_fields_by_name.get(yaml_field['name'], ()):
+            yaml_len = yaml_field['length']
+            protocol_len = protocol_field['length']
+            
+            # 处理变长字段：如果协议长度为-1（变长）而配置使用变长标识符，则认为匹配
+            is_varlen_match = (protocol_len == -1 and 
+                             isinstance(yaml_len, str) and 
+                             yaml_len not in ['0', '1', '2', '4', '8'])
+            
+            if yaml_len != protocol_len and not is_varlen_match:
+                result['length_mismatches'].append({
+                    'field': yaml_field['name'],
+                    'yaml_length': yaml_len,
+                    'protocol_length': protocol_len
+                })
+                result['issues'].append(
+                    f"字段长度不匹配 '{yaml_field['name']}': "
+                    f"配置={yaml_len}, 协议={protocol_len}"
+                )
     
     if result['issues']:
         result['status'] = 'MISMATCH'
@@ -771,9 +840,9 @@ def detect_manual_review_case(result: Dict) -> Optional[str]:
 
             # 如果大多数多余字段是位字段，且缺失字段疑似汇总字段，则提示人工处理
             if bitfield_like and len(bitfield_like) >= max(4, int(len(extra_field_details) * 0.6)):
-                if any(re.search(r'(状态|反馈|告警|位|位图)', name) for name in missing_fields):
+                if any(_SUMMARY_FIELD_RE.search(name) for name in missing_fields):
                     base_names = {
-                        re.sub(r'[0-9一二三四五六七八九十]+$', '', name).strip()
+                        _TRAILING_NUMERAL_RE.sub('', name).strip()
                         for name in missing_fields
                     }
                     base_names = {name for name in base_names if name}
@@ -795,7 +864,7 @@ def detect_manual_review_case(result: Dict) -> Optional[str]:
     ]
 
     if repeat_fields and missing_fields:
-        numeric_missing = [name for name in missing_fields if re.search(r'\d', name)]
+        numeric_missing = [name for name in missing_fields if _HAS_DIGIT_RE.search(name)]
         if numeric_missing:
             sample_missing = '、'.join(numeric_missing[:3])
             repeat_names = sorted({field['name'] for field in repeat_fields})
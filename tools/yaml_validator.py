@@ -17,6 +17,11 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from enum import Enum
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML 未带 libyaml 扩展时回退到纯Python实现
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ErrorLevel(Enum):
     """错误级别"""
@@ -145,7 +150,7 @@ class YamlConfigValidator:
         
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                self.config_data = yaml.safe_load(f)
+                self.config_data = yaml.load(f, Loader=_YamlLoader)
         except UnicodeDecodeError as e:
             self.result.add_error(
                 location="文件编码",